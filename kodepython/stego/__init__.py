@@ -0,0 +1,42 @@
+"""Steganografi citra dengan Polar Code, Reed-Muller, dan Multiple LSB.
+
+Atribut publik dimuat secara malas dari submodulnya (PEP 562), sehingga
+`import stego` tidak ikut memuat numpy, cv2, maupun matplotlib.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "run_autotune": "autotune",
+    "compute_capacity": "planner",
+    "plan_embedding": "planner",
+    "embed_image": "polar_stego",
+    "embed_image_tiled": "polar_stego",
+    "extract_image": "polar_stego",
+    "extract_image_cached": "polar_stego",
+    "extract_image_tiled": "polar_stego",
+    "polar_decode": "polar_stego",
+    "polar_encode": "polar_stego",
+    "embed_image_reed_muller": "reed_muller",
+    "extract_image_reed_muller": "reed_muller",
+    "evaluate_pair": "evaluate",
+    "image_metrics": "metrics",
+    "image_metrics_batch": "metrics",
+    "bit_error_rate": "ber",
+    "bit_error_stats": "ber",
+    "DistortionTracker": "distortion",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
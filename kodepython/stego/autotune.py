@@ -0,0 +1,261 @@
+"""Autotuner empiris untuk parameter embedding pada sampel cover nyata.
+
+Setiap trial (cover, konfigurasi) meng-embed payload sebesar kapasitas
+konfigurasi itu ke cover dan mengukur PSNR/SSIM terhadap cover. Hasil trial
+di-memoize di `result_cache` dengan kunci hash isi cover dan konfigurasi,
+sehingga pencarian ulang dengan grid yang tumpang tindih hanya menghitung
+trial baru.
+"""
+
+import hashlib
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .batch import list_images
+from .metrics import image_metrics
+from .planner import cover_pixels, plan_embedding
+from .polar_stego import embed_image
+from .reed_muller import embed_image_reed_muller
+from .result_cache import memoize
+
+PSNR_FLOOR_DB = 40.0
+DEFAULT_GRID = {
+    "scheme": ["polar", "reed_muller"],
+    "num_lsb": [1, 2, 3, 4],
+    "info_size": [256, 512, 768],
+    "layout": [None, "interleaved"],
+}
+
+_use_cache = True
+
+
+def sample_covers(directory, sample=None, seed=0):
+    """Path cover di `directory`; `sample` membatasi ke sampel acak (deterministik per `seed`)."""
+    paths = list_images(directory)
+    if sample is not None and sample < len(paths):
+        rng = np.random.default_rng(seed)
+        paths = [paths[i] for i in sorted(rng.choice(len(paths), sample, replace=False))]
+    return paths
+
+
+def config_grid(grid=None):
+    """Semua konfigurasi dari `grid`; parameter yang tidak berlaku untuk suatu skema
+    (num_lsb dan info_size untuk Reed-Muller) tidak digandakan."""
+    grid = {**DEFAULT_GRID, **(grid or {})}
+    configs = []
+    for layout in grid["layout"]:
+        for scheme in grid["scheme"]:
+            if scheme == "polar":
+                for num_lsb, info_size in itertools.product(grid["num_lsb"], grid["info_size"]):
+                    configs.append(
+                        {"scheme": scheme, "num_lsb": num_lsb, "info_size": info_size, "layout": layout}
+                    )
+            else:
+                configs.append({"scheme": scheme, "num_lsb": 8, "info_size": None, "layout": layout})
+    return configs
+
+
+def config_name(config):
+    """Nama ringkas konfigurasi untuk laporan."""
+    layout = config["layout"] or "gray"
+    if config["scheme"] == "polar":
+        return f"polar L={config['num_lsb']} K={config['info_size']} {layout}"
+    return f"{config['scheme']} {layout}"
+
+
+def _payload(cover, config, num_bytes):
+    """Payload acak deterministik: benih dari isi cover dan konfigurasi."""
+    seed = hashlib.blake2b(cover.tobytes()[:1 << 16], digest_size=8)
+    seed.update(repr(sorted(config.items())).encode())
+    rng = np.random.default_rng(int.from_bytes(seed.digest(), "little"))
+    return rng.integers(0, 256, num_bytes, dtype=np.uint8)
+
+
+def _embed_trial(cover, config):
+    """Embed payload sebesar kapasitas konfigurasi lewat jalur embedding yang sama
+    dengan `embed_image`; mengembalikan (referensi, stego, byte)."""
+    import cv2
+
+    layout = config["layout"]
+    reference = cv2.cvtColor(cover, cv2.COLOR_BGR2GRAY) if layout is None else cover
+    if config["scheme"] == "polar":
+        plan = plan_embedding(
+            cover.shape, 0, "polar", config["num_lsb"], layout, info_size=config["info_size"]
+        )
+        num_bytes = plan["capacity_bits"] // 8
+        payload = _payload(cover, config, num_bytes)
+        stego = embed_image(
+            cover, payload, config["num_lsb"], layout=layout, info_size=config["info_size"]
+        )
+    else:
+        plan = plan_embedding(cover.shape, 0, "reed_muller", layout=layout)
+        num_bytes = plan["capacity_bits"] // 8
+        payload = _payload(cover, config, num_bytes)
+        stego = embed_image_reed_muller(cover, payload, layout=layout)
+    return reference, stego, num_bytes
+
+
+def run_trial(cover, config, use_cache=True):
+    """Satu trial: kapasitas (bpp) dan PSNR/SSIM konfigurasi pada satu cover."""
+
+    def compute():
+        reference, stego, num_bytes = _embed_trial(cover, config)
+        quality = image_metrics(reference, stego, workers=1)
+        return {
+            "payload_bytes": num_bytes,
+            "bpp": num_bytes * 8 / cover_pixels(cover.shape),
+            "psnr": quality["psnr"],
+            "ssim": quality["ssim"],
+        }
+
+    return memoize("autotune_trial", [cover], config, compute, None if use_cache else False)
+
+
+def _init_worker(use_cache):
+    global _use_cache
+    import cv2  # noqa: F401
+
+    _use_cache = use_cache
+
+
+def _trial_task(task):
+    import cv2
+
+    cover_path, config = task
+    cover = cv2.imread(cover_path)
+    if cover is None:
+        raise ValueError(f"Cover tidak dapat dibaca: {cover_path}")
+    return run_trial(cover, config, _use_cache)
+
+
+def _prune_dominated(alive, failed):
+    """Konfigurasi polar dengan num_lsb lebih besar dari yang gagal (layout dan K sama)
+    pasti lebih terdistorsi, sehingga ikut dipangkas tanpa dievaluasi."""
+    pruned = set()
+    for i in alive:
+        for j in failed:
+            a, b = alive[i], failed[j]
+            if (
+                a["scheme"] == b["scheme"] == "polar"
+                and a["layout"] == b["layout"]
+                and a["info_size"] == b["info_size"]
+                and a["num_lsb"] > b["num_lsb"]
+            ):
+                pruned.add(i)
+    return pruned
+
+
+def pareto_front(rows):
+    """Baris yang tidak didominasi pada (bpp, psnr): tidak ada baris lain yang
+    setidaknya sama baik di keduanya dan lebih baik di salah satunya."""
+    front = [
+        row
+        for row in rows
+        if not any(
+            other["bpp"] >= row["bpp"]
+            and other["psnr"] >= row["psnr"]
+            and (other["bpp"] > row["bpp"] or other["psnr"] > row["psnr"])
+            for other in rows
+        )
+    ]
+    return sorted(front, key=lambda row: row["bpp"])
+
+
+def run_autotune(cover_paths, grid=None, psnr_floor=PSNR_FLOOR_DB, workers=None, use_cache=True):
+    """Mencari konfigurasi dengan kapasitas terbesar yang tetap di atas `psnr_floor`.
+
+    Cover dievaluasi bergiliran; di setiap giliran semua konfigurasi yang
+    masih hidup dievaluasi paralel pada satu cover. Konfigurasi yang PSNR-nya
+    sudah di bawah batas pada salah satu cover langsung dihentikan (early
+    stopping), begitu pula konfigurasi polar yang pasti lebih terdistorsi.
+
+    Cover yang tidak dapat dibaca diperiksa sekali sebelum trial-nya
+    dikirim, lalu dilewati dan dicatat, sehingga semua konfigurasi dievaluasi
+    pada himpunan cover yang sama. Trial yang gagal (mis. `info_size` tidak
+    valid) menghentikan konfigurasinya saja dengan status "error", seperti
+    pasangan gagal di `batch.run_pair`. Konfigurasi yang tidak pernah
+    dievaluasi berstatus "not_evaluated"; keduanya tidak ikut `pareto` dan
+    `best`.
+
+    Returns:
+        dict: `rows` (satu per konfigurasi: status, pesan galat, bpp
+        rata-rata, PSNR dan SSIM terburuk, jumlah cover yang dievaluasi),
+        `pareto` (front bpp vs PSNR dari konfigurasi yang lolos), `best` (bpp
+        terbesar yang lolos, atau None), dan `failed_covers` (cover dan pesan
+        galatnya).
+    """
+    import cv2
+
+    configs = config_grid(grid)
+    alive = dict(enumerate(configs))
+    stats = {i: {"bpp": [], "psnr": [], "ssim": []} for i in alive}
+    status = {}
+    errors = {}
+    failed_covers = []
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(use_cache,)
+    ) as pool:
+        for cover_path in cover_paths:
+            if not alive:
+                break
+            if cv2.imread(cover_path) is None:
+                failed_covers.append(
+                    {"cover": cover_path, "error": f"Cover tidak dapat dibaca: {cover_path}"}
+                )
+                continue
+            # num_lsb kecil lebih dulu, agar kegagalannya sempat membatalkan
+            # trial num_lsb besar yang belum berjalan.
+            order = sorted(alive, key=lambda i: alive[i]["num_lsb"])
+            futures = {pool.submit(_trial_task, (cover_path, alive[i])): i for i in order}
+            pending = {i: future for future, i in futures.items()}
+            for future in as_completed(futures):
+                i = futures[future]
+                del pending[i]
+                if future.cancelled() or i not in alive:
+                    continue  # dipangkas saat masih antre atau berjalan
+                try:
+                    result = future.result()
+                except Exception as exc:  # konfigurasi gagal tidak menghentikan pencarian
+                    status[i] = "error"
+                    errors[i] = f"{type(exc).__name__}: {exc}"
+                    del alive[i]
+                    continue
+                for metric in ("bpp", "psnr", "ssim"):
+                    stats[i][metric].append(result[metric])
+                if result["psnr"] >= psnr_floor:
+                    continue
+                status[i] = "below_floor"
+                failed = {i: alive.pop(i)}
+                for j in _prune_dominated(alive, failed):
+                    status[j] = "pruned"
+                    del alive[j]
+                    if j in pending:
+                        pending[j].cancel()
+
+    rows = []
+    for i, config in enumerate(configs):
+        evaluated = len(stats[i]["psnr"])
+        rows.append(
+            {
+                "config": config_name(config),
+                **config,
+                "status": status.get(i, "ok" if evaluated else "not_evaluated"),
+                "error": errors.get(i),
+                "covers": evaluated,
+                "bpp": float(np.mean(stats[i]["bpp"])) if evaluated else 0.0,
+                "psnr": float(np.min(stats[i]["psnr"])) if evaluated else float("nan"),
+                "ssim": float(np.min(stats[i]["ssim"])) if evaluated else float("nan"),
+            }
+        )
+    passing = [row for row in rows if row["status"] == "ok"]
+    return {
+        "rows": rows,
+        "pareto": pareto_front(passing),
+        "best": max(passing, key=lambda row: row["bpp"]) if passing else None,
+        "failed_covers": failed_covers,
+    }
@@ -0,0 +1,187 @@
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import polar_stego
+from .ber import bit_error_rate
+from .metrics import image_metrics
+from .planner import compute_capacity
+from .result_cache import memoize
+from .selection import DEFAULT_KEY
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")
+RESULT_FIELDS = [
+    "name",
+    "host",
+    "secret",
+    "stego",
+    "status",
+    "error",
+    "mse",
+    "psnr",
+    "ssim",
+    "ber",
+    "bpp",
+    "embed_seconds",
+    "extract_seconds",
+]
+
+_options = {}
+
+
+def _init_worker(options):
+    """Inisialisasi worker sekali: import cv2 dan hangatkan tabel information set."""
+    import cv2  # noqa: F401
+
+    _options.update(options)
+    polar_stego.polar_info_set(info_size=_options.get("info_size", polar_stego.POLAR_INFO_SIZE))
+
+
+def list_images(directory):
+    """Daftar file gambar dalam direktori, terurut berdasarkan nama."""
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+
+
+def read_manifest(path, columns=("host", "secret")):
+    """Membaca manifest CSV dengan dua kolom path `columns` dan opsional `name`.
+
+    Default-nya kolom `host` dan `secret` (batch embedding); evaluasi memakai
+    `secret` dan `extracted`. Path relatif dianggap relatif terhadap lokasi
+    manifest. `name` kosong menjadi None.
+    """
+    first, second = columns
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    return [
+        (
+            os.path.join(base, row[first]),
+            os.path.join(base, row[second]),
+            row.get("name") or None,
+        )
+        for row in rows
+    ]
+
+
+def pair_directories(covers_dir, secrets_dir, cross=False):
+    """Memasangkan cover dan secret: berurutan (zip), atau semua kombinasi jika `cross`."""
+    covers = list_images(covers_dir)
+    secrets = list_images(secrets_dir)
+    if cross:
+        return [(host, secret, None) for host, secret in itertools.product(covers, secrets)]
+    if len(covers) != len(secrets):
+        raise ValueError("Jumlah cover dan secret tidak sama; gunakan --cross untuk semua kombinasi.")
+    return [(host, secret, None) for host, secret in zip(covers, secrets)]
+
+
+def _task_name(host_path, secret_path):
+    host = os.path.splitext(os.path.basename(host_path))[0]
+    secret = os.path.splitext(os.path.basename(secret_path))[0]
+    return f"{host}__{secret}"
+
+
+def run_pair(task):
+    """Embed, ekstraksi, dan metrik untuk satu pasangan (host, secret) di worker."""
+    import cv2
+
+    host_path, secret_path, name = task
+    name = name or _task_name(host_path, secret_path)
+    row = {"name": name, "host": host_path, "secret": secret_path, "status": "ok"}
+    num_lsb = _options["num_lsb"]
+    layout = _options["layout"]
+    selection = _options.get("selection")
+    key = _options.get("key", DEFAULT_KEY)
+    crc_poly = _options["crc_poly"]
+    info_size = _options.get("info_size", polar_stego.POLAR_INFO_SIZE)
+    cache = None if _options.get("cache", True) else False
+
+    try:
+        host = cv2.imread(host_path)
+        secret_flag = cv2.IMREAD_COLOR if _options["secret_color"] else cv2.IMREAD_GRAYSCALE
+        secret = cv2.imread(secret_path, secret_flag)
+        if host is None or secret is None:
+            raise ValueError("Gambar host atau secret tidak dapat dibaca.")
+
+        start = time.perf_counter()
+        embedded, distortion = polar_stego.embed_image(
+            host,
+            secret,
+            num_lsb,
+            crc_poly=crc_poly,
+            layout=layout,
+            selection=selection,
+            key=key,
+            min_psnr=_options.get("min_psnr"),
+            return_distortion=True,
+            info_size=info_size,
+        )
+        row["embed_seconds"] = time.perf_counter() - start
+        row["mse"] = distortion["mse"]
+        row["psnr"] = distortion["psnr"]
+
+        stego_path = os.path.join(_options["output_dir"], f"{name}.png")
+        cv2.imwrite(stego_path, embedded)
+        row["stego"] = stego_path
+
+        start = time.perf_counter()
+        extracted = polar_stego.extract_image_cached(
+            embedded,
+            secret.shape,
+            num_lsb,
+            _options["list_size"],
+            crc_poly,
+            layout,
+            selection,
+            key,
+            cache,
+            info_size,
+        )
+        row["extract_seconds"] = time.perf_counter() - start
+
+        # MSE/PSNR sudah dari embedding; SSIM (opsional) butuh lintasan penuh.
+        if _options.get("ssim", True):
+            reference = cv2.cvtColor(host, cv2.COLOR_BGR2GRAY) if layout is None else host
+            row["ssim"] = memoize(
+                "ssim",
+                [reference, embedded],
+                {},
+                lambda: image_metrics(reference, embedded, workers=1)["ssim"],
+                cache,
+            )
+        row["ber"] = bit_error_rate(secret, extracted)
+        row["bpp"] = compute_capacity(secret, host)
+    except Exception as exc:  # satu pasangan gagal tidak menghentikan batch
+        row["status"] = "error"
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    return row
+
+
+def run_batch(tasks, options, results_path, workers=None, chunksize=4):
+    """Menjalankan semua pasangan pada process pool dan menulis CSV hasil.
+
+    Worker dipakai ulang untuk banyak pasangan, sehingga biaya import
+    cv2 dan pembuatan tabel Polar Code hanya dibayar sekali per worker.
+
+    Returns:
+        int: Jumlah pasangan yang gagal.
+    """
+    os.makedirs(options["output_dir"], exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    failures = 0
+
+    with open(results_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(options,)
+        ) as pool:
+            for row in pool.map(run_pair, tasks, chunksize=chunksize):
+                writer.writerow(row)
+                failures += row["status"] != "ok"
+    return failures
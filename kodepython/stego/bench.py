@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from .lsb import embed_payload, embed_payload_selected, symbol_count
+from .polar import CRC16_CCITT, crc_width, decode, encode, hard_to_llr
+from .polar_construction import info_set
+from .selection import ORDERS, selection_chunks
+
+
+def bench_list_sizes(list_sizes, block_length, info_size, num_codewords, crossover, seed=0):
+    """Mengukur throughput dekoder CA-SCL (bit informasi terdekode per detik).
+
+    Returns:
+        list[dict]: Satu baris per ukuran list berisi throughput dan BER.
+    """
+    rng = np.random.default_rng(seed)
+    info_positions = info_set(block_length, info_size)
+    payload_size = info_size - crc_width(CRC16_CCITT)
+
+    bits = rng.integers(0, 2, num_codewords * payload_size, dtype=np.uint8)
+    codewords = encode(bits, block_length, info_positions, CRC16_CCITT)
+    noise = (rng.random(codewords.size) < crossover).astype(np.uint8)
+    llr = hard_to_llr(codewords ^ noise, crossover)
+
+    rows = []
+    for list_size in list_sizes:
+        start = time.perf_counter()
+        decoded = decode(llr, bits.size, block_length, info_positions, list_size, CRC16_CCITT)
+        elapsed = time.perf_counter() - start
+        rows.append(
+            {
+                "list_size": list_size,
+                "seconds": elapsed,
+                "bits_per_second": bits.size / elapsed,
+                "ber": float(np.mean(decoded != bits)),
+            }
+        )
+    return rows
+
+
+def bench_selection(megapixels=(1, 16, 100), fill=0.25, num_lsb=2, key=0, seed=0):
+    """Membandingkan throughput penulisan LSB: berurutan, acak global, dan acak per tile.
+
+    Cover grayscale berukuran `megapixels` juta piksel diisi payload sebanyak
+    `fill` bagian dari kapasitasnya. Waktu mencakup pembangkitan posisi
+    Feistel dan penulisan LSB.
+
+    Returns:
+        list[dict]: Satu baris per (ukuran cover, urutan) berisi waktu dan
+        simbol per detik.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for mp in megapixels:
+        cover = np.zeros(int(mp * 1_000_000), dtype=np.uint8)
+        payload = rng.integers(0, 256, int(cover.size * fill * num_lsb) // 8, dtype=np.uint8)
+        total = symbol_count(payload.size, num_lsb)
+        for order in ("sequential",) + ORDERS:
+            start = time.perf_counter()
+            if order == "sequential":
+                embed_payload([cover], payload, num_lsb)
+            else:
+                chunks = selection_chunks(total, cover.size, key, order)
+                embed_payload_selected(cover, payload, num_lsb, chunks)
+            elapsed = time.perf_counter() - start
+            rows.append(
+                {
+                    "megapixels": mp,
+                    "order": order,
+                    "seconds": elapsed,
+                    "symbols_per_second": total / elapsed,
+                }
+            )
+    return rows
+
+
+def _median_seconds(command, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def bench_startup(repeats=5):
+    """Mengukur waktu cold-start CLI di proses baru (median `repeats` kali).
+
+    Returns:
+        list[dict]: Waktu untuk `--help` tanpa subcommand, `embed --help`,
+        dan embed kecil (cover 64x64, secret 8x8) lengkap dengan baca/tulis PNG.
+    """
+    import cv2
+
+    rng = np.random.default_rng(0)
+    cli = [sys.executable, "-m", "stego"]
+    with tempfile.TemporaryDirectory() as tmp:
+        cover_path = os.path.join(tmp, "cover.png")
+        secret_path = os.path.join(tmp, "secret.png")
+        cv2.imwrite(cover_path, rng.integers(0, 256, (64, 64, 3), dtype=np.uint8))
+        cv2.imwrite(secret_path, rng.integers(0, 256, (8, 8), dtype=np.uint8))
+        commands = {
+            "--help": cli + ["--help"],
+            "embed --help": cli + ["embed", "--help"],
+            "embed 64x64": cli
+            + ["embed", cover_path, secret_path, "-o", os.path.join(tmp, "stego.png")],
+        }
+        return [
+            {"command": name, "seconds": _median_seconds(command, repeats)}
+            for name, command in commands.items()
+        ]
@@ -0,0 +1,93 @@
+import numpy as np
+
+# Jumlah bit 1 untuk setiap nilai byte, dipakai jika numpy belum punya bitwise_count.
+POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+NUM_PLANES = 8
+# PLANE_TABLE[v, p] = bit ke-p (0 = LSB) dari nilai byte v.
+PLANE_TABLE = (np.arange(256)[:, None] >> np.arange(NUM_PLANES)) & 1
+
+
+def popcount(data):
+    """Jumlah bit 1 per elemen array uint8 (`np.bitwise_count` atau tabel 256 entri)."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(data)
+    return POPCOUNT_TABLE[data]
+
+
+def _as_batch(secrets, extracted):
+    secrets = np.asarray(secrets, dtype=np.uint8)
+    extracted = np.asarray(extracted, dtype=np.uint8)
+    if secrets.shape != extracted.shape:
+        raise ValueError("Ukuran secret image dan extracted image tidak sama!")
+    return secrets, extracted
+
+
+def bit_errors(secret, extracted):
+    """Jumlah bit yang berbeda antara dua gambar uint8 (popcount dari XOR)."""
+    secret, extracted = _as_batch(secret, extracted)
+    return int(popcount(secret ^ extracted).sum(dtype=np.int64))
+
+
+def bit_error_rate(secret, extracted):
+    """BER sebenarnya: bit berbeda dibagi jumlah bit (8 per byte)."""
+    secret, extracted = _as_batch(secret, extracted)
+    return bit_errors(secret, extracted) / (secret.size * 8)
+
+
+def _block_sums(counts, block_size):
+    """Menjumlahkan `counts` (B, H, W) per blok spasial; blok tepi boleh tidak penuh."""
+    bh, bw = block_size
+    batch, height, width = counts.shape
+    rows, cols = -(-height // bh), -(-width // bw)
+    padded = np.zeros((batch, rows * bh, cols * bw), dtype=counts.dtype)
+    padded[:, :height, :width] = counts
+    return padded.reshape(batch, rows, bh, cols, bw).sum(axis=(2, 4))
+
+
+def bit_error_stats(secrets, extracted, block_size=None):
+    """BER untuk satu batch pasangan gambar sekaligus, dirinci per bit-plane dan blok.
+
+    `secrets` dan `extracted` berukuran (B, H, W) atau (B, H, W, C) bertipe
+    uint8. XOR dihitung sekali untuk seluruh batch dan dibaca sekali untuk
+    histogram 256 nilai per gambar; jumlah error per bit-plane dan totalnya
+    diturunkan dari histogram itu lewat `PLANE_TABLE`. Rincian per blok
+    memakai satu popcount per piksel.
+
+    Args:
+        secrets: Batch secret image asli.
+        extracted: Batch hasil ekstraksi dengan bentuk yang sama.
+        block_size: (tinggi, lebar) blok spasial untuk rincian per blok, atau
+            None untuk melewatkannya.
+
+    Returns:
+        dict: `errors` dan `ber` (B,), `plane_errors` dan `plane_ber` (B, 8)
+        dengan plane 0 = LSB, serta `block_errors` dan `block_ber`
+        (B, baris_blok, kolom_blok) jika `block_size` diberikan.
+    """
+    secrets, extracted = _as_batch(secrets, extracted)
+    if secrets.ndim not in (3, 4):
+        raise ValueError("Batch harus berbentuk (B, H, W) atau (B, H, W, C).")
+    diff = secrets ^ extracted
+    batch = diff.shape[0]
+    pixels_per_image = diff[0].size
+    histogram = np.stack([np.bincount(image, minlength=256) for image in diff.reshape(batch, -1)])
+
+    plane_errors = histogram @ PLANE_TABLE
+    errors = plane_errors.sum(axis=1)
+    stats = {
+        "errors": errors,
+        "ber": errors / (pixels_per_image * 8),
+        "plane_errors": plane_errors,
+        "plane_ber": plane_errors / pixels_per_image,
+    }
+
+    if block_size is not None:
+        counts = popcount(diff).astype(np.int32)
+        if counts.ndim == 4:
+            counts = counts.sum(axis=3, dtype=np.int32)
+        channels = diff.shape[3] if diff.ndim == 4 else 1
+        block_errors = _block_sums(counts, block_size)
+        block_bits = _block_sums(np.ones((1,) + counts.shape[1:], dtype=np.int32), block_size)
+        stats["block_errors"] = block_errors
+        stats["block_ber"] = block_errors / (block_bits * channels * 8)
+    return stats
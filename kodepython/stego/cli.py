@@ -0,0 +1,478 @@
+"""Command-line interface paket `stego`.
+
+Modul ini sengaja hanya memakai pustaka standar di level atas: numpy, cv2,
+dan matplotlib baru di-import di dalam handler perintah, sehingga `--help`
+dan parsing argumen tetap cepat.
+"""
+
+import argparse
+import os
+import sys
+
+MEMMAP_EXTENSIONS = (".npy", ".raw")
+DEFAULT_EMBED_OUTPUT = "embedded_polar_code.png"
+DEFAULT_TILED_EMBED_OUTPUT = "embedded_polar_code.npy"
+LAYOUTS = ("interleaved", "planar")
+SELECTION_ORDERS = ("global", "tiled")
+
+
+def _is_memmap_path(path):
+    return os.path.splitext(path)[1].lower() in MEMMAP_EXTENSIONS
+
+
+def _crc_poly(args):
+    from .polar import CRC16_CCITT
+    from .polar_stego import POLAR_CRC_POLY
+
+    return CRC16_CCITT if args.crc else POLAR_CRC_POLY
+
+
+def _cache(args):
+    # None: cache default di STEGO_CACHE_DIR; False: cache dimatikan.
+    return False if args.no_cache else None
+
+
+def _add_cache_argument(parser):
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Jangan pakai cache hasil (STEGO_CACHE_DIR)"
+    )
+
+
+def _add_budget_argument(parser):
+    parser.add_argument(
+        "--min-psnr", type=float, default=None, help="Hentikan embedding jika PSNR turun di bawah nilai ini (dB)"
+    )
+
+
+def _add_code_arguments(parser):
+    parser.add_argument("--num-lsb", type=int, default=2, help="Jumlah LSB per sampel (1-4)")
+    parser.add_argument("--layout", choices=LAYOUTS, default=None, help="Mode RGB (default grayscale)")
+    parser.add_argument("--crc", action="store_true", help="Tempelkan CRC-16 (CA-SCL)")
+    parser.add_argument(
+        "--selection",
+        choices=SELECTION_ORDERS,
+        default=None,
+        help="Sebar simbol ke piksel pilihan kunci (default berurutan)",
+    )
+    parser.add_argument("--key", default="0", help="Kunci pemilihan piksel untuk --selection")
+    parser.add_argument(
+        "--info-size", type=int, default=512, help="K bit informasi per blok polar N=1024"
+    )
+
+
+def _embed(args, secret):
+    """Embedding ke file output; mengembalikan ringkasan distorsi."""
+    from . import polar_stego
+
+    import cv2
+
+    if _is_memmap_path(args.host):
+        if args.selection:
+            raise SystemExit("--selection tidak didukung untuk cover .npy/.raw (mode tile).")
+        _, distortion = polar_stego.embed_image_tiled(
+            args.host,
+            args.output,
+            secret,
+            args.num_lsb,
+            crc_poly=_crc_poly(args),
+            layout=args.layout,
+            shape=args.host_shape,
+            min_psnr=args.min_psnr,
+            return_distortion=True,
+            info_size=args.info_size,
+        )
+    else:
+        host = cv2.imread(args.host)
+        if host is None:
+            raise SystemExit(f"Host image tidak dapat dibaca: {args.host}")
+        embedded, distortion = polar_stego.embed_image(
+            host,
+            secret,
+            args.num_lsb,
+            crc_poly=_crc_poly(args),
+            layout=args.layout,
+            selection=args.selection,
+            key=args.key,
+            min_psnr=args.min_psnr,
+            return_distortion=True,
+            info_size=args.info_size,
+        )
+        cv2.imwrite(args.output, embedded)
+    return distortion
+
+
+def _embed_output(args):
+    """Path output embedding; cover .npy/.raw ditulis sebagai memmap, bukan gambar."""
+    if not _is_memmap_path(args.host):
+        return args.output or DEFAULT_EMBED_OUTPUT
+    if args.output is None:
+        return DEFAULT_TILED_EMBED_OUTPUT
+    if not _is_memmap_path(args.output):
+        raise SystemExit(
+            f"Cover .npy/.raw menghasilkan memmap; output harus berekstensi .npy atau .raw: {args.output}"
+        )
+    return args.output
+
+
+def _run_embed(args):
+    import cv2
+
+    args.output = _embed_output(args)
+
+    flag = cv2.IMREAD_COLOR if args.secret_color else cv2.IMREAD_GRAYSCALE
+    secret = cv2.imread(args.secret, flag)
+    if secret is None:
+        raise SystemExit(f"Secret image tidak dapat dibaca: {args.secret}")
+
+    try:
+        distortion = _embed(args, secret)
+    except ValueError as exc:  # termasuk DistortionBudgetExceeded
+        raise SystemExit(str(exc))
+    print(f"Stego image: {args.output}")
+    print(f"Secret shape: {' '.join(map(str, secret.shape))}")
+    print(f"MSE: {distortion['mse']:.4f}  PSNR: {distortion['psnr']:.2f} dB")
+    return 0
+
+
+def _run_extract(args):
+    from . import polar_stego
+
+    import cv2
+
+    secret_shape = tuple(args.shape)
+    if _is_memmap_path(args.stego):
+        if args.selection:
+            raise SystemExit("--selection tidak didukung untuk stego .npy/.raw (mode tile).")
+        extracted = polar_stego.extract_image_tiled(
+            args.stego,
+            secret_shape,
+            args.num_lsb,
+            args.list_size,
+            _crc_poly(args),
+            args.layout,
+            shape=args.stego_shape,
+            info_size=args.info_size,
+        )
+    else:
+        flag = cv2.IMREAD_GRAYSCALE if args.layout is None else cv2.IMREAD_COLOR
+        embedded = cv2.imread(args.stego, flag)
+        if embedded is None:
+            raise SystemExit(f"Stego image tidak dapat dibaca: {args.stego}")
+        extracted = polar_stego.extract_image_cached(
+            embedded,
+            secret_shape,
+            args.num_lsb,
+            args.list_size,
+            _crc_poly(args),
+            args.layout,
+            args.selection,
+            args.key,
+            cache=_cache(args),
+            info_size=args.info_size,
+        )
+    cv2.imwrite(args.output, extracted)
+    print(f"Secret hasil ekstraksi: {args.output}")
+    return 0
+
+
+def _run_eval_batch(args, parser):
+    from . import batch, evaluate
+
+    if args.manifest:
+        tasks = batch.read_manifest(args.manifest, evaluate.MANIFEST_COLUMNS)
+    else:
+        if not args.extracted_dir:
+            parser.error("--secrets membutuhkan --extracted-dir")
+        tasks = evaluate.pair_directories(args.secrets, args.extracted_dir)
+
+    summary = evaluate.run_evaluation(
+        tasks, args.results, args.workers, args.figures, use_cache=not args.no_cache
+    )
+    print(f"{summary['pairs']} pasangan ({summary['failed']} gagal) -> {args.results}")
+    for metric in evaluate.METRICS:
+        if metric in summary:
+            stats = summary[metric]
+            print(f"{metric.upper():<5} mean={stats['mean']:.6g} std={stats['std']:.6g}"
+                  f" min={stats['min']:.6g} max={stats['max']:.6g}")
+    return 1 if summary["failed"] else 0
+
+
+def _run_eval(args, parser):
+    from .evaluate import evaluate_pair_cached, load_pair, show_comparison
+
+    if args.manifest or args.secrets:
+        return _run_eval_batch(args, parser)
+    if not (args.secret and args.extracted):
+        parser.error("eval membutuhkan <secret> <extracted>, --secrets, atau --manifest")
+
+    try:
+        secret, extracted = load_pair(args.secret, args.extracted)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    metrics = evaluate_pair_cached(secret, extracted, cache=_cache(args))
+    print(f"PSNR Secret Image: {metrics['psnr']:.2f} dB")
+    print(f"SSIM Secret Image: {metrics['ssim']:.4f}")
+    print(f"MSE Secret Image: {metrics['mse']:.4f}")
+    print(f"NCC Secret Image: {metrics['ncc']:.6f}")
+    print(f"Bit Error Rate (BER): {metrics['ber']:.6f}")
+    if args.show:
+        show_comparison(secret, extracted)
+    return 0
+
+
+def _run_plan(args):
+    import math
+
+    from .planner import plan_embedding
+
+    payload_bytes = args.payload_bytes
+    if args.secret_shape:
+        payload_bytes = math.prod(args.secret_shape)
+    plan = plan_embedding(
+        tuple(args.cover_shape),
+        payload_bytes,
+        args.scheme,
+        args.num_lsb,
+        args.layout,
+        _crc_poly(args),
+        info_size=args.info_size,
+    )
+    print(f"Skema: {plan['scheme']}  sampel pembawa: {plan['carrier_samples']}")
+    print(f"Payload: {plan['payload_bits']} bit, ditulis {plan['encoded_bits']} bit")
+    print(f"Kapasitas: {plan['capacity_bits']} bit ({'muat' if plan['fits'] else 'TIDAK muat'})")
+    if args.scheme == "key_trace":
+        print(f"Siklus: {plan['num_cycles']}  key trace: {plan['key_trace_bits']} bit")
+    print(f"Laju payload: {plan['bpp']:.4f} bpp")
+    print(f"Perkiraan MSE: {plan['mse']:.4f}  PSNR: {plan['psnr']:.2f} dB")
+    return 0 if plan["fits"] else 1
+
+
+def _json_clean(value):
+    """Salinan `value` yang aman untuk JSON standar: NaN/inf menjadi null."""
+    from .evaluate import _json_value
+
+    if isinstance(value, dict):
+        return {key: _json_clean(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_clean(item) for item in value]
+    return _json_value(value)
+
+
+def _run_tune(args):
+    import json
+
+    from .autotune import run_autotune, sample_covers
+
+    covers = sample_covers(args.covers, args.sample, args.seed)
+    if not covers:
+        raise SystemExit(f"Tidak ada cover di {args.covers}")
+    grid = {"num_lsb": args.num_lsb, "info_size": args.info_size, "scheme": args.schemes}
+    result = run_autotune(
+        covers, grid, args.psnr_floor, args.workers, use_cache=not args.no_cache
+    )
+    print(f"{len(covers)} cover, batas PSNR {args.psnr_floor:g} dB")
+    for failure in result["failed_covers"]:
+        print(f"Cover dilewati: {failure['cover']} ({failure['error']})")
+    for row in sorted(result["rows"], key=lambda row: -row["bpp"]):
+        print(
+            f"{row['config']:<32} {row['status']:<13} {row['bpp']:7.4f} bpp"
+            f"  PSNR min {row['psnr']:6.2f} dB  SSIM min {row['ssim']:.4f}  ({row['covers']} cover)"
+        )
+        if row["error"]:
+            print(f"  {row['error']}")
+    print("Pareto front (bpp vs PSNR):")
+    for row in result["pareto"]:
+        print(f"  {row['config']:<32} {row['bpp']:7.4f} bpp  {row['psnr']:6.2f} dB")
+    best = result["best"]
+    print(f"Terbaik: {best['config']} ({best['bpp']:.4f} bpp)" if best else "Tidak ada konfigurasi yang lolos.")
+    if args.results:
+        with open(args.results, "w") as f:
+            json.dump(_json_clean(result), f, indent=2)
+    return 0 if best else 1
+
+
+def _run_bench(args):
+    from . import bench
+
+    if args.target == "selection":
+        print(f"fill={args.fill} num_lsb={args.num_lsb}")
+        for row in bench.bench_selection(args.megapixels, args.fill, args.num_lsb):
+            print(
+                f"{row['megapixels']:>6g} MP  {row['order']:<10}"
+                f" {row['symbols_per_second'] / 1e6:8.1f} Msym/s  ({row['seconds']:.2f} s)"
+            )
+        return 0
+
+    if args.target == "startup":
+        for row in bench.bench_startup(args.repeats):
+            print(f"{row['command']:<14} {row['seconds'] * 1e3:8.1f} ms")
+        return 0
+
+    print(f"N={args.block_length} K={args.info_size} CRC-16 p={args.crossover}")
+    for row in bench.bench_list_sizes(
+        args.list_sizes, args.block_length, args.info_size, args.codewords, args.crossover
+    ):
+        print(
+            f"L={row['list_size']:>3}  {row['bits_per_second'] / 1e3:10.1f} kbit/s"
+            f"  ({row['seconds']:.2f} s)  BER={row['ber']:.2e}"
+        )
+    return 0
+
+
+def _run_batch(args, parser):
+    import time
+
+    from . import batch
+
+    if args.manifest:
+        tasks = batch.read_manifest(args.manifest)
+    else:
+        if not args.secrets:
+            parser.error("--covers membutuhkan --secrets")
+        tasks = batch.pair_directories(args.covers, args.secrets, args.cross)
+
+    options = {
+        "num_lsb": args.num_lsb,
+        "layout": args.layout,
+        "selection": args.selection,
+        "key": args.key,
+        "list_size": args.list_size,
+        "crc_poly": _crc_poly(args),
+        "info_size": args.info_size,
+        "secret_color": args.secret_color,
+        "output_dir": args.output_dir,
+        "cache": not args.no_cache,
+        "min_psnr": args.min_psnr,
+        "ssim": not args.no_ssim,
+    }
+    start = time.perf_counter()
+    failures = batch.run_batch(tasks, options, args.results, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"{len(tasks)} pasangan selesai dalam {elapsed:.1f} s ({failures} gagal) -> {args.results}")
+    return 1 if failures else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="stego", description="Steganografi citra dengan Polar Code dan Multiple LSB."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    embed = commands.add_parser("embed", help="Sisipkan secret image ke host image")
+    embed.add_argument("host", help="Host image (PNG/JPG, atau .npy/.raw untuk mode tile)")
+    embed.add_argument("secret", help="Secret image")
+    embed.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help=f"Default {DEFAULT_EMBED_OUTPUT}, atau {DEFAULT_TILED_EMBED_OUTPUT} untuk cover .npy/.raw",
+    )
+    embed.add_argument("--secret-color", action="store_true", help="Baca secret sebagai BGR")
+    embed.add_argument("--host-shape", type=int, nargs="+", help="Bentuk host .raw (H W [C])")
+    _add_budget_argument(embed)
+    _add_code_arguments(embed)
+
+    extract = commands.add_parser("extract", help="Ekstraksi secret image dari stego image")
+    extract.add_argument("stego", help="Stego image (PNG, atau .npy/.raw untuk mode tile)")
+    extract.add_argument("--shape", type=int, nargs="+", required=True, help="Bentuk secret (H W [C])")
+    extract.add_argument("-o", "--output", default="extracted_polar_code.png")
+    extract.add_argument("--list-size", type=int, default=1, help="Ukuran list SCL")
+    extract.add_argument("--stego-shape", type=int, nargs="+", help="Bentuk stego .raw (H W [C])")
+    _add_code_arguments(extract)
+    _add_cache_argument(extract)
+
+    evaluate = commands.add_parser("eval", help="PSNR/SSIM/BER secret vs hasil ekstraksi")
+    evaluate.add_argument("secret", nargs="?")
+    evaluate.add_argument("extracted", nargs="?")
+    evaluate.add_argument("--show", action="store_true", help="Tampilkan gambar dan heatmap")
+    headless = evaluate.add_argument_group("mode batch (tanpa GUI)")
+    source = headless.add_mutually_exclusive_group()
+    source.add_argument("--manifest", help="CSV dengan kolom secret,extracted[,name]")
+    source.add_argument("--secrets", help="Direktori secret (dipakai bersama --extracted-dir)")
+    headless.add_argument("--extracted-dir", help="Direktori hasil ekstraksi, dipasangkan per nama file")
+    headless.add_argument("--results", default="eval_results.csv", help="File hasil .csv atau .json")
+    headless.add_argument("--workers", type=int, default=None, help="Default: jumlah core")
+    headless.add_argument("--figures", help="Simpan figure perbandingan ke direktori ini")
+    _add_cache_argument(evaluate)
+
+    plan = commands.add_parser("plan", help="Kapasitas dan distorsi analitis tanpa embedding")
+    plan.add_argument("--cover-shape", type=int, nargs="+", required=True, help="H W [C]")
+    payload = plan.add_mutually_exclusive_group(required=True)
+    payload.add_argument("--payload-bytes", type=int)
+    payload.add_argument("--secret-shape", type=int, nargs="+", help="H W [C]")
+    plan.add_argument("--scheme", choices=["polar", "reed_muller", "key_trace"], default="polar")
+    _add_code_arguments(plan)
+
+    bench = commands.add_parser("bench", help="Benchmark dekoder, pemilihan piksel, dan start-up CLI")
+    bench.add_argument("target", choices=["scl", "selection", "startup"])
+    bench.add_argument("--list-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 32])
+    bench.add_argument("--block-length", type=int, default=1024)
+    bench.add_argument("--info-size", type=int, default=512)
+    bench.add_argument("--codewords", type=int, default=500)
+    bench.add_argument("--crossover", type=float, default=0.05, help="Probabilitas bit flip BSC")
+    bench.add_argument("--repeats", type=int, default=5, help="Pengulangan untuk startup")
+    bench.add_argument("--megapixels", type=float, nargs="+", default=[1, 16, 100])
+    bench.add_argument("--fill", type=float, default=0.25, help="Bagian kapasitas yang diisi")
+    bench.add_argument("--num-lsb", type=int, default=2)
+
+    tune = commands.add_parser("tune", help="Cari konfigurasi berkapasitas terbesar di atas batas PSNR")
+    tune.add_argument("covers", help="Direktori cover")
+    tune.add_argument("--sample", type=int, default=None, help="Jumlah cover acak yang dievaluasi")
+    tune.add_argument("--seed", type=int, default=0, help="Benih pengambilan sampel cover")
+    tune.add_argument("--psnr-floor", type=float, default=40.0, help="Batas bawah PSNR (dB)")
+    tune.add_argument("--schemes", nargs="+", choices=["polar", "reed_muller"], default=["polar", "reed_muller"])
+    tune.add_argument("--num-lsb", type=int, nargs="+", default=[1, 2, 3, 4])
+    tune.add_argument("--info-size", type=int, nargs="+", default=[256, 512, 768], help="K per blok polar")
+    tune.add_argument("--workers", type=int, default=None, help="Default: jumlah core")
+    tune.add_argument("--results", help="Simpan semua baris dan Pareto front ke file JSON")
+    _add_cache_argument(tune)
+
+    batch = commands.add_parser("batch", help="Batch embedding untuk banyak cover dan secret")
+    source = batch.add_mutually_exclusive_group(required=True)
+    source.add_argument("--manifest", help="CSV dengan kolom host,secret[,name]")
+    source.add_argument("--covers", help="Direktori cover (dipakai bersama --secrets)")
+    batch.add_argument("--secrets", help="Direktori secret")
+    batch.add_argument("--cross", action="store_true", help="Semua kombinasi cover x secret")
+    batch.add_argument("--output-dir", default="batch_output")
+    batch.add_argument("--results", default="batch_results.csv")
+    batch.add_argument("--workers", type=int, default=None, help="Default: jumlah core")
+    batch.add_argument("--list-size", type=int, default=1)
+    batch.add_argument("--secret-color", action="store_true", help="Baca secret sebagai BGR")
+    batch.add_argument("--no-ssim", action="store_true", help="Lewati SSIM (tanpa lintasan perbandingan kedua)")
+    _add_budget_argument(batch)
+    _add_code_arguments(batch)
+    _add_cache_argument(batch)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "batch":
+        return _run_batch(args, parser)
+    if args.command == "eval":
+        return _run_eval(args, parser)
+    handlers = {
+        "embed": _run_embed,
+        "extract": _run_extract,
+        "plan": _run_plan,
+        "bench": _run_bench,
+        "tune": _run_tune,
+    }
+    return handlers[args.command](args)
+
+
+def _command_main(command):
+    def entry(argv=None):
+        return main([command] + list(sys.argv[1:] if argv is None else argv))
+
+    entry.__name__ = f"{command}_main"
+    return entry
+
+
+embed_main = _command_main("embed")
+extract_main = _command_main("extract")
+eval_main = _command_main("eval")
+bench_main = _command_main("bench")
+batch_main = _command_main("batch")
+tune_main = _command_main("tune")
@@ -0,0 +1,79 @@
+"""Pelacakan distorsi (MSE/PSNR) selama penyisipan.
+
+Penyisip tahu persis sampel mana yang diubah dan berapa besar perubahannya,
+sehingga galat kuadrat terhadap pembawa asli dapat dijumlahkan saat menulis.
+MSE dan PSNR akhir sama persis dengan membandingkan ulang stego dan cover
+(`metrics.image_metrics`), tanpa lintasan kedua atas seluruh gambar.
+"""
+
+import math
+
+import numpy as np
+
+PIXEL_MAX = 255
+
+
+def psnr_from_mse(mse, peak=PIXEL_MAX):
+    """PSNR (dB) dari MSE; tak hingga jika MSE nol."""
+    return math.inf if mse == 0 else 10 * math.log10(peak**2 / mse)
+
+
+class DistortionBudgetExceeded(ValueError):
+    """Penyisipan dihentikan karena galat kuadrat melewati anggaran `min_psnr`.
+
+    Atribut `distortion` berisi ringkasan (lihat `DistortionTracker.summary`)
+    sampai titik berhenti.
+    """
+
+    def __init__(self, distortion):
+        super().__init__(
+            f"PSNR turun di bawah {distortion['min_psnr']:g} dB setelah "
+            f"{distortion['changed_samples']} sampel diubah."
+        )
+        self.distortion = distortion
+
+
+class DistortionTracker:
+    """Menjumlahkan galat kuadrat setiap penulisan terhadap nilai pembawa sebelumnya.
+
+    Args:
+        num_samples: Jumlah sampel pembawa (pembagi MSE), mis. H x W untuk
+            grayscale atau H x W x C untuk RGB.
+        min_psnr: Anggaran distorsi opsional (dB). Karena galat kuadrat hanya
+            bisa bertambah, penyisipan dihentikan dengan
+            `DistortionBudgetExceeded` begitu PSNR akhir pasti di bawah nilai ini.
+        peak: Nilai piksel maksimum untuk PSNR.
+    """
+
+    def __init__(self, num_samples, min_psnr=None, peak=PIXEL_MAX):
+        self.num_samples = int(num_samples)
+        self.min_psnr = min_psnr
+        self.peak = peak
+        self.squared_error = 0
+        self.changed_samples = 0
+        if min_psnr is None:
+            self.max_squared_error = math.inf
+        else:
+            self.max_squared_error = self.num_samples * peak**2 / 10 ** (min_psnr / 10)
+
+    def add(self, old, new):
+        """Mencatat penulisan `new` menggantikan `old` (array sebesar sama).
+
+        Cukup bagian yang berubah, mis. hanya LSB lama dan simbol baru.
+        """
+        diff = np.asarray(new, dtype=np.int32) - old
+        self.squared_error += int((diff * diff).sum(dtype=np.int64))
+        self.changed_samples += int(np.count_nonzero(diff))
+        if self.squared_error > self.max_squared_error:
+            raise DistortionBudgetExceeded(self.summary())
+
+    def summary(self):
+        """dict: `mse`, `psnr`, `squared_error`, `changed_samples`, dan `min_psnr`."""
+        mse = self.squared_error / self.num_samples
+        return {
+            "mse": mse,
+            "psnr": psnr_from_mse(mse, self.peak),
+            "squared_error": self.squared_error,
+            "changed_samples": self.changed_samples,
+            "min_psnr": self.min_psnr,
+        }
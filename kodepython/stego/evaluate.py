@@ -0,0 +1,236 @@
+import csv
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .batch import list_images
+from .ber import bit_error_rate
+from .metrics import image_metrics
+from .result_cache import memoize
+
+# Kolom path manifest evaluasi untuk `batch.read_manifest`.
+MANIFEST_COLUMNS = ("secret", "extracted")
+METRICS = ("psnr", "ssim", "mse", "ncc", "ber")
+RESULT_FIELDS = ["name", "secret", "extracted", "status", "error", *METRICS, "figure"]
+
+_figure_dir = None
+_cache = None
+
+
+def load_pair(secret_path, extracted_path):
+    """Membaca secret image dan hasil ekstraksi (grayscale) serta memvalidasi ukurannya."""
+    import cv2
+
+    secret = cv2.imread(secret_path, cv2.IMREAD_GRAYSCALE)
+    extracted = cv2.imread(extracted_path, cv2.IMREAD_GRAYSCALE)
+
+    if secret is None or extracted is None:
+        raise ValueError("Gambar secret atau extracted tidak ditemukan!")
+
+    # Pastikan ukuran sama
+    if secret.shape != extracted.shape:
+        raise ValueError("Ukuran secret image dan extracted image tidak sama!")
+
+    return secret, extracted
+
+
+def evaluate_pair(secret, extracted, workers=None):
+    """Menghitung PSNR, SSIM, MSE, NCC, dan BER antara secret image dan hasil ekstraksi."""
+    quality = image_metrics(secret, extracted, workers=workers)
+    return {
+        "psnr": quality["psnr"],
+        "ssim": quality["ssim"],
+        "mse": quality["mse"],
+        "ncc": quality["ncc"],
+        "ber": bit_error_rate(secret, extracted),  # popcount XOR / jumlah bit
+    }
+
+
+def evaluate_pair_cached(secret, extracted, workers=None, cache=None):
+    """`evaluate_pair` dengan cache berbasis hash isi kedua gambar (lihat `result_cache`)."""
+    return memoize(
+        "evaluate_pair",
+        [secret, extracted],
+        {},
+        lambda: evaluate_pair(secret, extracted, workers=workers),
+        cache,
+    )
+
+
+def show_comparison(secret, extracted):
+    """Menampilkan secret image, hasil ekstraksi, dan heatmap perbedaannya."""
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 5))
+
+    plt.subplot(1, 2, 1)
+    plt.title("Secret Image Asli")
+    plt.imshow(secret, cmap="gray")
+    plt.axis("off")
+
+    plt.subplot(1, 2, 2)
+    plt.title("Secret Image Ekstrak")
+    plt.imshow(extracted, cmap="gray")
+    plt.axis("off")
+
+    plt.show()
+
+    # Visualisasi Perbedaan dengan Heatmap
+    diff = np.abs(secret.astype(np.int16) - extracted.astype(np.int16))  # Hitung perbedaan absolut
+    plt.figure(figsize=(6, 5))
+    plt.title("Peta Perbedaan Secret Image")
+    plt.imshow(diff, cmap="hot")
+    plt.colorbar(label="Perbedaan Intensitas")
+    plt.axis("off")
+    plt.show()
+
+
+def save_comparison(secret, extracted, path):
+    """Menyimpan perbandingan dan heatmap perbedaan ke file tanpa jendela GUI.
+
+    Figure dirender langsung dengan canvas Agg, sehingga aman dipanggil dari
+    worker tanpa display dan tidak mengubah backend pyplot global.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(15, 5))
+    FigureCanvasAgg(fig)
+    panels = [("Secret Image Asli", secret), ("Secret Image Ekstrak", extracted)]
+    for i, (title, image) in enumerate(panels, start=1):
+        ax = fig.add_subplot(1, 3, i)
+        ax.set_title(title)
+        ax.imshow(image, cmap="gray")
+        ax.axis("off")
+
+    diff = np.abs(secret.astype(np.int16) - extracted.astype(np.int16))
+    ax = fig.add_subplot(1, 3, 3)
+    ax.set_title("Peta Perbedaan Secret Image")
+    heatmap = ax.imshow(diff, cmap="hot")
+    fig.colorbar(heatmap, ax=ax, label="Perbedaan Intensitas")
+    ax.axis("off")
+    fig.savefig(path)
+
+
+def _stem(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def pair_directories(secrets_dir, extracted_dir):
+    """Memasangkan secret dan hasil ekstraksi dengan nama file (tanpa ekstensi) yang sama.
+
+    Secret tanpa pasangan tetap dikembalikan dengan `extracted` = None agar
+    tercatat sebagai baris gagal, bukan hilang diam-diam.
+    """
+    extracted = {}
+    for path in list_images(extracted_dir):
+        extracted.setdefault(_stem(path), path)
+    return [(path, extracted.get(_stem(path)), _stem(path)) for path in list_images(secrets_dir)]
+
+
+def _init_worker(figure_dir, use_cache):
+    """Inisialisasi worker sekali: import cv2, simpan direktori figure dan pilihan cache."""
+    global _figure_dir, _cache
+    import cv2  # noqa: F401
+
+    _figure_dir = figure_dir
+    _cache = None if use_cache else False
+
+
+def evaluate_task(task):
+    """Mengevaluasi satu pasangan (secret, extracted, name) menjadi satu baris hasil.
+
+    `name` None (manifest tanpa kolom `name`) diganti nama file secret.
+    """
+    secret_path, extracted_path, name = task
+    name = name or _stem(secret_path)
+    row = {"name": name, "secret": secret_path, "extracted": extracted_path, "status": "ok"}
+    try:
+        if extracted_path is None:
+            raise ValueError("Hasil ekstraksi tidak ditemukan untuk secret ini.")
+        secret, extracted = load_pair(secret_path, extracted_path)
+        # Paralelisme ada di level proses; metrik cukup satu thread per worker.
+        row.update(evaluate_pair_cached(secret, extracted, workers=1, cache=_cache))
+        if _figure_dir is not None:
+            row["figure"] = os.path.join(_figure_dir, f"{name}.png")
+            save_comparison(secret, extracted, row["figure"])
+    except Exception as exc:  # satu pasangan gagal tidak menghentikan evaluasi
+        row["status"] = "error"
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    return row
+
+
+def summarize(rows):
+    """Statistik agregat (mean, std, min, median, max) per metrik atas baris yang berhasil.
+
+    PSNR tak hingga (gambar identik) tidak ikut dirata-rata, tetapi dihitung
+    terpisah di `psnr_infinite`.
+    """
+    ok = [row for row in rows if row["status"] == "ok"]
+    summary = {"pairs": len(rows), "ok": len(ok), "failed": len(rows) - len(ok)}
+    for metric in METRICS:
+        values = np.array([float(row[metric]) for row in ok], dtype=np.float64)
+        finite = values[np.isfinite(values)]
+        if metric == "psnr":
+            summary["psnr_infinite"] = int(values.size - finite.size)
+        if finite.size == 0:
+            continue
+        summary[metric] = {
+            "mean": float(finite.mean()),
+            "std": float(finite.std()),
+            "min": float(finite.min()),
+            "median": float(np.median(finite)),
+            "max": float(finite.max()),
+        }
+    return summary
+
+
+def _json_value(value):
+    # JSON standar tidak mengenal inf/NaN; PSNR gambar identik ditulis sebagai null.
+    if isinstance(value, (float, np.floating)):
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def run_evaluation(
+    tasks, results_path, workers=None, figure_dir=None, use_cache=True, chunksize=8
+):
+    """Mengevaluasi semua pasangan pada process pool tanpa membuka jendela apa pun.
+
+    Hasil ditulis ke `results_path`: CSV (satu baris per pasangan) atau, jika
+    berekstensi `.json`, objek berisi `rows` dan `summary`. Untuk CSV, statistik
+    agregat ditulis ke `<nama>.summary.json` di sebelahnya. Figure hanya
+    dirender jika `figure_dir` diberikan. Dengan `use_cache`, metrik pasangan
+    yang isinya tidak berubah diambil dari `result_cache`.
+
+    Returns:
+        dict: Statistik agregat dari `summarize`.
+    """
+    if figure_dir is not None:
+        os.makedirs(figure_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(figure_dir, use_cache)
+    ) as pool:
+        rows = list(pool.map(evaluate_task, tasks, chunksize=chunksize))
+    summary = summarize(rows)
+
+    stem, ext = os.path.splitext(results_path)
+    if ext.lower() == ".json":
+        rows_json = [{k: _json_value(row.get(k)) for k in RESULT_FIELDS} for row in rows]
+        with open(results_path, "w") as f:
+            json.dump({"rows": rows_json, "summary": summary}, f, indent=2)
+    else:
+        with open(results_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        with open(f"{stem}.summary.json", "w") as f:
+            json.dump(summary, f, indent=2)
+    return summary
@@ -0,0 +1,232 @@
+import numpy as np
+
+NUM_LSB_MAX = 4
+LAYOUTS = ("interleaved", "planar")
+CHUNK_SYMBOLS = 1 << 20
+
+
+def lsb_mask(num_lsb):
+    """Mask bit rendah untuk `num_lsb` LSB (mis. 2 -> 0b11)."""
+    if not 1 <= num_lsb <= NUM_LSB_MAX:
+        raise ValueError(f"num_lsb harus antara 1 dan {NUM_LSB_MAX}.")
+    return (1 << num_lsb) - 1
+
+
+def symbol_count(num_bytes, num_lsb):
+    """Jumlah piksel (simbol `num_lsb` bit) yang dibutuhkan untuk `num_bytes` byte."""
+    lsb_mask(num_lsb)
+    return -(-int(num_bytes) * 8 // num_lsb)
+
+
+def split_symbols(payload, num_lsb):
+    """Memecah byte payload menjadi simbol `num_lsb` bit, dimulai dari bit terendah.
+
+    Untuk `num_lsb` yang membagi 8 (1, 2, 4) urutannya sama persis dengan
+    loop lama: simbol ke-j dari satu byte adalah `(byte >> (j * num_lsb)) & mask`.
+    Untuk `num_lsb` = 3 payload diperlakukan sebagai satu aliran bit kontinu
+    (LSB-first) sehingga tidak ada bit yang terbuang di batas byte.
+
+    Args:
+        payload (np.ndarray): Array uint8 berisi byte yang akan disisipkan.
+        num_lsb (int): Jumlah LSB per piksel (1-4).
+
+    Returns:
+        np.ndarray: Array uint8 berisi satu simbol per piksel tujuan.
+    """
+    mask = lsb_mask(num_lsb)
+    payload = np.ascontiguousarray(payload, dtype=np.uint8).ravel()
+
+    if 8 % num_lsb == 0:
+        shifts = np.arange(0, 8, num_lsb, dtype=np.uint8)
+        return ((payload[:, None] >> shifts) & mask).ravel()
+
+    bits = np.unpackbits(payload, bitorder="little")
+    pad = (-bits.size) % num_lsb
+    if pad:
+        bits = np.concatenate([bits, np.zeros(pad, dtype=np.uint8)])
+    weights = (1 << np.arange(num_lsb, dtype=np.uint8)).astype(np.uint8)
+    return (bits.reshape(-1, num_lsb) * weights).sum(axis=1, dtype=np.uint8)
+
+
+def symbols_at(payload, start, count, num_lsb):
+    """Simbol ke-`start` s.d. `start + count - 1` dari `split_symbols(payload)`.
+
+    Hanya byte payload yang menutupi rentang tersebut yang dipecah, sehingga
+    penyisipan per tile tidak perlu memecah seluruh payload sekaligus.
+    """
+    mask = lsb_mask(num_lsb)
+    count = max(0, min(count, symbol_count(payload.size, num_lsb) - start))
+    first_bit = start * num_lsb
+    byte_start = first_bit // 8
+    byte_stop = min(payload.size, -(-(first_bit + count * num_lsb) // 8))
+
+    if 8 % num_lsb == 0:
+        skip = (first_bit - byte_start * 8) // num_lsb
+        return split_symbols(payload[byte_start:byte_stop], num_lsb)[skip : skip + count]
+
+    bits = np.unpackbits(payload[byte_start:byte_stop], bitorder="little")
+    bits = bits[first_bit - byte_start * 8 :]
+    needed = count * num_lsb
+    if bits.size < needed:
+        bits = np.concatenate([bits, np.zeros(needed - bits.size, dtype=np.uint8)])
+    weights = (1 << np.arange(num_lsb, dtype=np.uint8)).astype(np.uint8)
+    return (bits[:needed].reshape(count, num_lsb) * weights).sum(axis=1, dtype=np.uint8) & mask
+
+
+def embed_symbols(flat, symbols, num_lsb, tracker=None):
+    """Menulis simbol ke LSB piksel pertama `flat` secara in-place.
+
+    Semua piksel tujuan ditulis dengan satu operasi bitwise ber-mask. Jika
+    `tracker` (`distortion.DistortionTracker`) diberikan, galat LSB lama
+    terhadap simbol baru dicatat sebelum ditulis.
+    """
+    mask = lsb_mask(num_lsb)
+    n = symbols.size
+    if n > flat.size:
+        raise ValueError("Jumlah simbol melebihi jumlah piksel host.")
+    target = flat[:n]
+    if tracker is not None:
+        tracker.add(target & np.uint8(mask), symbols)
+    np.bitwise_or(target & np.uint8(0xFF ^ mask), symbols, out=target)
+    return flat
+
+
+def extract_symbols(flat, num_symbols, num_lsb):
+    """Membaca `num_symbols` simbol LSB dari piksel pertama `flat` dalam satu slice."""
+    mask = lsb_mask(num_lsb)
+    return flat[:num_symbols] & np.uint8(mask)
+
+
+def join_symbols(symbols, num_bytes, num_lsb):
+    """Kebalikan `split_symbols`: menyusun kembali simbol menjadi `num_bytes` byte.
+
+    Simbol yang kurang (piksel host habis) dianggap nol.
+    """
+    symbols = np.ascontiguousarray(symbols, dtype=np.uint8).ravel()
+    needed = symbol_count(num_bytes, num_lsb)
+    if symbols.size < needed:
+        symbols = np.concatenate(
+            [symbols, np.zeros(needed - symbols.size, dtype=np.uint8)]
+        )
+    symbols = symbols[:needed]
+
+    if 8 % num_lsb == 0:
+        shifts = np.arange(0, 8, num_lsb, dtype=np.uint8)
+        groups = symbols.reshape(-1, 8 // num_lsb) << shifts
+        return np.bitwise_or.reduce(groups, axis=1).astype(np.uint8)
+
+    bits = (symbols[:, None] >> np.arange(num_lsb, dtype=np.uint8)) & 1
+    return np.packbits(bits.ravel()[: num_bytes * 8], bitorder="little")
+
+
+def carrier_segments(img, layout=None):
+    """View 1-D (tanpa salinan) atas sampel pembawa, sesuai urutan penyisipan.
+
+    Args:
+        img (np.ndarray): Array C-contiguous H x W (grayscale) atau H x W x C.
+        layout (str | None): `None` atau "interleaved" memakai buffer datar apa
+            adanya (B, G, R, B, G, R, ...); "planar" mengisi seluruh kanal
+            pertama dulu, lalu kanal berikutnya, lewat view ber-stride per kanal.
+
+    Returns:
+        list[np.ndarray]: View 1-D yang dapat ditulis in-place.
+    """
+    if not img.flags.c_contiguous:
+        raise ValueError("Image pembawa harus C-contiguous.")
+    if layout not in (None,) + LAYOUTS:
+        raise ValueError(f"Layout harus None atau salah satu dari {LAYOUTS}.")
+    if layout == "planar" and img.ndim == 3:
+        pixels = img.reshape(-1, img.shape[2])
+        return [pixels[:, channel] for channel in range(img.shape[2])]
+    return [img.reshape(-1)]
+
+
+def carrier_flat_index(indices, shape, layout=None):
+    """Memetakan indeks urutan pembawa ke indeks buffer datar (interleaved)."""
+    indices = np.asarray(indices)
+    if layout != "planar" or len(shape) != 3:
+        return indices
+    num_pixels = shape[0] * shape[1]
+    channel, pixel = np.divmod(indices, num_pixels)
+    return pixel * shape[2] + channel
+
+
+def pack_symbols_into(payload, start, symbols, num_lsb):
+    """Menulis simbol ke-`start` dst. ke buffer payload ter-pack (kebalikan `symbols_at`).
+
+    Bit simbol di-OR ke `payload`, sehingga buffer harus berawal nol dan setiap
+    simbol hanya ditulis sekali; awal yang tidak sejajar byte ditangani dengan
+    padding bit di depan.
+    """
+    first_bit = start * num_lsb
+    byte_start, lead = divmod(first_bit, 8)
+    bits = (symbols[:, None] >> np.arange(num_lsb, dtype=np.uint8)) & 1
+    bits = np.concatenate([np.zeros(lead, dtype=np.uint8), bits.ravel()])
+    packed = np.packbits(bits, bitorder="little")
+    byte_stop = min(payload.size, byte_start + packed.size)
+    payload[byte_start:byte_stop] |= packed[: byte_stop - byte_start]
+
+
+def embed_payload(segments, payload, num_lsb, chunk_symbols=CHUNK_SYMBOLS, tracker=None):
+    """Menyisipkan payload ter-pack ke segmen pembawa, per potongan `chunk_symbols`.
+
+    Payload baru dipecah menjadi simbol per piksel di batas penulisan, sehingga
+    memori sementara dibatasi ukuran potongan, bukan ukuran payload.
+    Distorsi dicatat ke `tracker` per potongan (lihat `embed_symbols`).
+    """
+    total = symbol_count(payload.size, num_lsb)
+    if total > sum(segment.size for segment in segments):
+        raise ValueError("Jumlah simbol melebihi jumlah sampel pembawa.")
+    offset = 0
+    for segment in segments:
+        for start in range(0, min(segment.size, total - offset), chunk_symbols):
+            count = min(chunk_symbols, segment.size - start)
+            symbols = symbols_at(payload, offset + start, count, num_lsb)
+            embed_symbols(segment[start:], symbols, num_lsb, tracker)
+        offset += segment.size
+        if offset >= total:
+            break
+
+
+def extract_payload(segments, num_bytes, num_lsb, chunk_symbols=CHUNK_SYMBOLS):
+    """Membaca `num_bytes` byte payload ter-pack dari segmen pembawa, per potongan."""
+    mask = np.uint8(lsb_mask(num_lsb))
+    total = symbol_count(num_bytes, num_lsb)
+    payload = np.zeros(num_bytes, dtype=np.uint8)
+    offset = 0
+    for segment in segments:
+        for start in range(0, min(segment.size, total - offset), chunk_symbols):
+            stop = min(start + chunk_symbols, segment.size, total - offset)
+            pack_symbols_into(payload, offset + start, segment[start:stop] & mask, num_lsb)
+        offset += segment.size
+        if offset >= total:
+            break
+    return payload
+
+
+def embed_payload_selected(carrier, payload, num_lsb, chunks, layout=None, tracker=None):
+    """Seperti `embed_payload`, tetapi simbol ke-k ditulis ke sampel pembawa terpilih.
+
+    `chunks` menghasilkan pasangan (awal, posisi) dalam urutan simbol, misalnya
+    dari `selection.selection_chunks`; posisi dalam urutan pembawa `layout`.
+    """
+    mask = lsb_mask(num_lsb)
+    flat = carrier.reshape(-1)
+    for start, positions in chunks:
+        index = carrier_flat_index(positions, carrier.shape, layout)
+        symbols = symbols_at(payload, start, positions.size, num_lsb)
+        old = flat[index]
+        if tracker is not None:
+            tracker.add(old & np.uint8(mask), symbols)
+        flat[index] = (old & np.uint8(~mask & 0xFF)) | symbols
+
+
+def extract_payload_selected(carrier, num_bytes, num_lsb, chunks, layout=None):
+    """Kebalikan `embed_payload_selected`: membaca `num_bytes` byte payload ter-pack."""
+    mask = np.uint8(lsb_mask(num_lsb))
+    flat = carrier.reshape(-1)
+    payload = np.zeros(num_bytes, dtype=np.uint8)
+    for start, positions in chunks:
+        index = carrier_flat_index(positions, carrier.shape, layout)
+        pack_symbols_into(payload, start, flat[index] & mask, num_lsb)
+    return payload
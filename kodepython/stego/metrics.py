@@ -0,0 +1,199 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+SSIM_WIN_SIZE = 7
+SSIM_K1 = 0.01
+SSIM_K2 = 0.03
+TILE_ELEMENTS = 1 << 18
+MIN_TILE_ROWS = 64
+
+
+def _data_range(dtype, data_range):
+    if data_range is not None:
+        return float(data_range)
+    if not np.issubdtype(dtype, np.integer):
+        raise ValueError("data_range wajib diberikan untuk gambar bertipe float.")
+    info = np.iinfo(dtype)
+    return float(info.max - info.min)
+
+
+def _as_planes(reference, distorted):
+    """Menyusun batch (B, H, W[, C]) menjadi plane (B * C, H, W) yang berdampingan."""
+    reference = np.asarray(reference)
+    distorted = np.asarray(distorted)
+    if reference.shape != distorted.shape:
+        raise ValueError("Ukuran gambar referensi dan gambar uji tidak sama!")
+    if reference.ndim == 3:
+        reference, distorted = reference[..., None], distorted[..., None]
+    elif reference.ndim != 4:
+        raise ValueError("Batch harus berbentuk (B, H, W) atau (B, H, W, C).")
+    batch, height, width, channels = reference.shape
+    if min(height, width) < SSIM_WIN_SIZE:
+        raise ValueError(f"Gambar harus minimal {SSIM_WIN_SIZE}x{SSIM_WIN_SIZE} piksel untuk SSIM.")
+
+    def planes(a):
+        return np.ascontiguousarray(np.moveaxis(a, 3, 1)).reshape(-1, height, width)
+
+    return planes(reference), planes(distorted), (batch, channels)
+
+
+def _window_means(a):
+    """Rata-rata jendela 7x7 untuk setiap plane di `a` (P, baris, W), ukuran penuh.
+
+    Semua plane ditumpuk menjadi satu gambar tinggi untuk satu panggilan
+    `cv2.boxFilter` (filter kotak terpisah). Hanya bagian valid (tepi
+    `SSIM_WIN_SIZE // 2` dibuang) yang bermakna; pemotongan ditunda sampai
+    penjumlahan akhir agar operasi elemen tetap pada array kontigu.
+    """
+    import cv2
+
+    num_planes, rows, width = a.shape
+    means = cv2.boxFilter(a.reshape(-1, width), -1, (SSIM_WIN_SIZE, SSIM_WIN_SIZE))
+    return means.reshape(num_planes, rows, width)
+
+
+def _tile_stats(x, y, r0, r1, o0, o1, data_range):
+    """Statistik satu band baris untuk semua plane di `x` dan `y` sekaligus.
+
+    Band berisi baris keluaran SSIM [o0, o1) (koordinat valid) dan baris
+    masukan [r0, r1) untuk jumlah global (MSE, NCC); keduanya dihitung dari
+    hasil kali yang sama. Nilai piksel integer membuat jumlah jendela dalam
+    float64 eksak.
+    """
+    win = SSIM_WIN_SIZE
+    xb = x[:, o0 : o1 + win - 1].astype(np.float64)
+    yb = y[:, o0 : o1 + win - 1].astype(np.float64)
+    xx, yy, xy = xb * xb, yb * yb, xb * yb
+
+    own = slice(r0 - o0, r1 - o0)
+    diff = xb[:, own] - yb[:, own]
+    totals = np.stack(
+        [
+            np.einsum("pij,pij->p", diff, diff),
+            xx[:, own].sum(axis=(1, 2)),
+            yy[:, own].sum(axis=(1, 2)),
+            xy[:, own].sum(axis=(1, 2)),
+        ],
+        axis=1,
+    )
+
+    area = win * win
+    cov_norm = area / (area - 1)  # kovarians sampel, sama dengan skimage
+    ux, uy = _window_means(xb), _window_means(yb)
+    uxy = ux * uy
+    u2 = ux * ux
+    u2 += uy * uy
+    # vx + vy dan vxy langsung, tanpa menyimpan variansi masing-masing.
+    var_sum = _window_means(xx)
+    var_sum += _window_means(yy)
+    var_sum -= u2
+    var_sum *= cov_norm
+    cov = _window_means(xy)
+    cov -= uxy
+    cov *= cov_norm
+
+    c1 = (SSIM_K1 * data_range) ** 2
+    c2 = (SSIM_K2 * data_range) ** 2
+    numerator = 2 * uxy + c1
+    numerator *= 2 * cov + c2
+    u2 += c1
+    var_sum += c2
+    u2 *= var_sum
+    numerator /= u2
+    pad = win // 2
+    rows, width = numerator.shape[1:]
+    return totals, numerator[:, pad : rows - pad, pad : width - pad].sum(axis=(1, 2))
+
+
+def _tiles(num_planes, height, width):
+    """Membagi pekerjaan menjadi tile (kelompok plane x band baris) sekitar `TILE_ELEMENTS`.
+
+    Band baris minimal `MIN_TILE_ROWS` baris agar tumpang tindih 6 baris
+    jendela SSIM tetap kecil; gambar kecil dikelompokkan beberapa plane
+    sekaligus.
+    """
+    out_rows = height - SSIM_WIN_SIZE + 1
+    step = min(out_rows, max(MIN_TILE_ROWS, TILE_ELEMENTS // width))
+    group = max(1, TILE_ELEMENTS // (step * width))
+    tiles = []
+    for p0 in range(0, num_planes, group):
+        p1 = min(num_planes, p0 + group)
+        for o0 in range(0, out_rows, step):
+            o1 = min(out_rows, o0 + step)
+            tiles.append((p0, p1, o0, height if o1 == out_rows else o1, o0, o1))
+    return tiles
+
+
+def image_metrics_batch(reference, distorted, data_range=None, workers=None):
+    """MSE, PSNR, NCC, dan SSIM untuk satu batch pasangan gambar dalam satu lintasan.
+
+    Kedua gambar dibaca sekali per band baris; jumlah kuadrat, hasil kali, dan
+    rata-rata/variansi lokal (filter kotak 7x7 terpisah) dipakai bersama oleh
+    semua metrik. Tile (kelompok plane batch x kanal, per band baris)
+    diproses paralel oleh thread; numpy dan OpenCV melepas GIL. SSIM memakai parameter default
+    `skimage.metrics.structural_similarity` sehingga hasilnya sama.
+
+    Args:
+        reference: Batch gambar referensi (B, H, W) atau (B, H, W, C).
+        distorted: Batch gambar uji dengan bentuk yang sama.
+        data_range: Rentang nilai piksel; default dari dtype integer.
+        workers: Jumlah thread; default jumlah core.
+
+    Returns:
+        dict: `mse`, `psnr`, `ncc`, `ssim` berukuran (B,) untuk seluruh kanal
+        (SSIM dirata-rata antar kanal seperti `channel_axis` skimage), dan
+        `<metrik>_channels` berukuran (B, C) per kanal.
+    """
+    x, y, (batch, channels) = _as_planes(reference, distorted)
+    data_range = _data_range(x.dtype, data_range)
+    num_planes, height, width = x.shape
+    tiles = _tiles(num_planes, height, width)
+    totals = np.zeros((num_planes, 4))
+    ssim_sums = np.zeros(num_planes)
+
+    def run(tile):
+        p0, p1, *rows = tile
+        return p0, p1, _tile_stats(x[p0:p1], y[p0:p1], *rows, data_range)
+
+    with ThreadPoolExecutor(max_workers=min(len(tiles), workers or os.cpu_count() or 1)) as pool:
+        for p0, p1, (tile_totals, tile_ssim) in pool.map(run, tiles):
+            totals[p0:p1] += tile_totals
+            ssim_sums[p0:p1] += tile_ssim
+    totals = totals.reshape(batch, channels, 4)
+    ssim_sums = ssim_sums.reshape(batch, channels)
+    num_windows = (height - SSIM_WIN_SIZE + 1) * (width - SSIM_WIN_SIZE + 1)
+
+    sq_err, xx, yy, xy = np.moveaxis(totals, 2, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mse_channels = sq_err / (height * width)
+        mse = sq_err.sum(axis=1) / (height * width * channels)
+        metrics = {
+            "mse": mse,
+            "psnr": 10 * np.log10(data_range**2 / mse),
+            "ncc": xy.sum(axis=1) / np.sqrt(xx.sum(axis=1) * yy.sum(axis=1)),
+            "ssim": ssim_sums.mean(axis=1) / num_windows,
+            "mse_channels": mse_channels,
+            "psnr_channels": 10 * np.log10(data_range**2 / mse_channels),
+            "ncc_channels": xy / np.sqrt(xx * yy),
+            "ssim_channels": ssim_sums / num_windows,
+        }
+    return metrics
+
+
+def image_metrics(reference, distorted, data_range=None, workers=None):
+    """`image_metrics_batch` untuk satu pasangan; gambar RGB dihitung per kanal.
+
+    Returns:
+        dict: Metrik skalar `mse`, `psnr`, `ncc`, `ssim`, ditambah
+        `<metrik>_channels` (array per kanal) untuk gambar berkanal.
+    """
+    reference = np.asarray(reference)
+    batch = image_metrics_batch(
+        reference[None], np.asarray(distorted)[None], data_range, workers
+    )
+    metrics = {name: float(batch[name][0]) for name in ("mse", "psnr", "ncc", "ssim")}
+    if reference.ndim == 3:
+        metrics.update({name: batch[name][0] for name in batch if name.endswith("_channels")})
+    return metrics
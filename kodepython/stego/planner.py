@@ -0,0 +1,156 @@
+"""Perencana kapasitas dan distorsi analitis untuk semua skema embedding.
+
+Semua angka dihitung dari bentuk cover dan ukuran payload saja, tanpa
+menyentuh piksel. Distorsi memakai model perubahan LSB seragam: bit yang
+ditulis dan bit asli dianggap acak seragam dan saling bebas, sehingga
+mengganti `b` bit terendah satu sampel menghasilkan galat kuadrat rata-rata
+(4^b - 1) / 6 (0,5 untuk 1 LSB).
+"""
+
+import math
+
+from .distortion import psnr_from_mse
+from .lsb import symbol_count
+from .polar import crc_width, num_blocks
+from .polar_stego import POLAR_BLOCK_LENGTH, POLAR_INFO_SIZE, polar_encoded_size
+from .reed_muller import encoded_size, reed_solomon_params
+
+SCHEMES = ("polar", "reed_muller", "key_trace")
+# Porsi piksel yang dipakai skema key trace (tesis memakai 3/4 piksel).
+KEY_TRACE_PIXEL_FRACTION = 0.75
+
+
+def cover_pixels(cover_shape):
+    """Jumlah piksel (H x W) cover, tanpa menghitung kanal."""
+    return int(cover_shape[0]) * int(cover_shape[1])
+
+
+def carrier_samples(cover_shape, layout=None):
+    """Jumlah sampel pembawa: H x W untuk grayscale (`layout` None), H x W x C untuk RGB."""
+    if layout is None or len(cover_shape) == 2:
+        return cover_pixels(cover_shape)
+    return cover_pixels(cover_shape) * int(cover_shape[2])
+
+
+def lsb_change_mse(bits_replaced):
+    """Galat kuadrat rata-rata satu sampel yang `bits_replaced` bit terendahnya diganti acak."""
+    return (4**bits_replaced - 1) / 6
+
+
+def compute_capacity(secret_img, host_img):
+    """Menghitung kapasitas penyisipan dalam bit per pixel (bpp), sama untuk semua skema.
+
+    Pembaginya selalu H x W piksel cover, juga pada layout RGB, sama dengan
+    `bpp` di `plan_embedding` dan autotune.
+    """
+    return math.prod(secret_img.shape) * 8 / cover_pixels(host_img.shape)
+
+
+def _plan_polar(samples, payload_bits, num_lsb, crc_poly, info_size):
+    payload_size = info_size - crc_width(crc_poly)
+    encoded_bytes = polar_encoded_size(payload_bits, info_size=info_size, crc_poly=crc_poly)
+    # Sama dengan pemeriksaan kapasitas `_encode_secret`.
+    max_blocks = (samples * num_lsb // 8) * 8 // POLAR_BLOCK_LENGTH
+    return {
+        "encoded_bits": encoded_bytes * 8,
+        "capacity_bits": max_blocks * payload_size // 8 * 8,
+        "fits": encoded_bytes <= samples * num_lsb // 8,
+        "samples_changed": symbol_count(encoded_bytes, num_lsb),
+        "bits_per_sample": num_lsb,
+        "blocks": num_blocks(payload_bits, payload_size),
+    }
+
+
+def _plan_reed_muller(samples, payload_bits, n, k):
+    params = reed_solomon_params(n, k)
+    block = params["codeword_length"]
+    written = encoded_size(-(-payload_bits // 8), n, k)
+    return {
+        "encoded_bits": written * 8,
+        "capacity_bits": samples // block * params["message_length"] * 8,
+        "fits": written <= samples,
+        # Byte kode menggantikan seluruh nilai sampel (8 bit).
+        "samples_changed": written,
+        "bits_per_sample": 8,
+        "blocks": written // block,
+        **params,
+    }
+
+
+def _plan_key_trace(samples, payload_bits, pixel_fraction):
+    num_pixels = max(1, int(samples * pixel_fraction))
+    num_cycles = max(1, -(-payload_bits // num_pixels))
+    written = payload_bits if num_cycles == 1 else num_pixels
+    return {
+        "encoded_bits": written,
+        # Setiap siklus tambahan menambah `num_pixels` bit, dibayar dengan key trace.
+        "capacity_bits": num_pixels * num_cycles,
+        "fits": True,
+        "samples_changed": written,
+        "bits_per_sample": 1,
+        "num_cycles": num_cycles,
+        "key_trace_bits": num_pixels * (num_cycles - 1),
+        "num_pixels": num_pixels,
+    }
+
+
+def plan_embedding(
+    cover_shape,
+    payload_bytes,
+    scheme="polar",
+    num_lsb=2,
+    layout=None,
+    crc_poly=None,
+    n=4,
+    k=11,
+    pixel_fraction=KEY_TRACE_PIXEL_FRACTION,
+    info_size=POLAR_INFO_SIZE,
+):
+    """Rencana embedding analitis untuk satu skema.
+
+    Args:
+        cover_shape: Bentuk cover (H, W) atau (H, W, C).
+        payload_bytes: Ukuran secret dalam byte.
+        scheme: "polar", "reed_muller", atau "key_trace".
+        num_lsb: LSB per sampel untuk skema polar.
+        layout: None (grayscale) atau layout RGB, menentukan jumlah sampel.
+        crc_poly: Polinom CRC skema polar.
+        n, k: Parameter skema Reed-Muller: blok pesan `k` byte menjadi
+            codeword Reed-Solomon `2**n` byte.
+        pixel_fraction: Porsi sampel yang dipakai skema key trace.
+        info_size: Jumlah bit informasi per blok polar (laju kode K / N).
+
+    Returns:
+        dict: `payload_bits`, `encoded_bits` (bit yang ditulis ke kanal),
+        `capacity_bits` (bit payload maksimum yang muat), `fits`,
+        `samples_changed`, `num_cycles` dan `key_trace_bits` (key trace;
+        1 dan 0 untuk skema lain), `bpp`, serta `mse` dan `psnr` yang
+        diharapkan terhadap cover (grayscale bila `layout` None). Skema
+        Reed-Muller juga mencatat parameter blok (`codeword_length`,
+        `message_length`, `parity_length`, `blocks`).
+    """
+    if scheme not in SCHEMES:
+        raise ValueError(f"Skema harus salah satu dari {SCHEMES}.")
+    samples = carrier_samples(cover_shape, layout)
+    payload_bits = int(payload_bytes) * 8
+
+    if scheme == "polar":
+        plan = _plan_polar(samples, payload_bits, num_lsb, crc_poly, info_size)
+    elif scheme == "reed_muller":
+        plan = _plan_reed_muller(samples, payload_bits, n, k)
+    else:
+        plan = _plan_key_trace(samples, payload_bits, pixel_fraction)
+
+    plan.setdefault("num_cycles", 1)
+    plan.setdefault("key_trace_bits", 0)
+    changed = min(plan["samples_changed"], samples)
+    mse = changed / samples * lsb_change_mse(plan["bits_per_sample"])
+    plan.update(
+        scheme=scheme,
+        carrier_samples=samples,
+        payload_bits=payload_bits,
+        bpp=payload_bits / cover_pixels(cover_shape),
+        mse=mse,
+        psnr=psnr_from_mse(mse),
+    )
+    return plan
@@ -0,0 +1,522 @@
+import functools
+
+import numpy as np
+
+CRC8 = 0x107
+CRC16_CCITT = 0x11021
+
+
+def check_block_length(block_length):
+    """Memastikan panjang blok N berbentuk 2^n dan mengembalikan n."""
+    n = int(block_length).bit_length() - 1
+    if block_length < 2 or (1 << n) != block_length:
+        raise ValueError("Panjang blok polar harus berbentuk 2^n (n >= 1).")
+    return n
+
+
+def polar_transform(u):
+    """Transformasi butterfly Arikan x = u F^{(x)n} in-place pada sumbu terakhir.
+
+    `u` berukuran (jumlah_codeword, N) dan bertipe integer; setiap tahap XOR
+    dijalankan sekaligus untuk semua codeword, total O(N log N) per codeword.
+    """
+    num_words, block_length = u.shape
+    n = check_block_length(block_length)
+    for stage in range(n):
+        half = 1 << stage
+        view = u.reshape(num_words, -1, 2, half)
+        view[:, :, 0, :] ^= view[:, :, 1, :]
+    return u
+
+
+_INTRA_BYTE_MASKS = ((1, 0xAA), (2, 0xCC), (4, 0xF0))
+
+
+def polar_transform_packed(words):
+    """`polar_transform` untuk codeword ter-pack (MSB dulu), in-place.
+
+    `words` berukuran (jumlah_codeword, N / 8) bertipe uint8. Tiga tahap
+    pertama dikerjakan di dalam byte dengan shift dan mask; tahap berikutnya
+    meng-XOR setengah blok sebagai byte, atau sebagai uint64 jika blok cukup
+    besar, tanpa pernah membongkar bit.
+    """
+    num_words, num_bytes = words.shape
+    n = check_block_length(num_bytes * 8)
+    for half, mask in _INTRA_BYTE_MASKS[: min(n, 3)]:
+        words ^= (words << half) & np.uint8(mask)
+
+    wide = words.view(np.uint64) if num_bytes % 8 == 0 else None
+    for stage in range(3, n):
+        half_bytes = 1 << (stage - 3)
+        if half_bytes % 8 == 0 and wide is not None:
+            view = wide.reshape(num_words, -1, 2, half_bytes // 8)
+        else:
+            view = words.reshape(num_words, -1, 2, half_bytes)
+        view[:, :, 0, :] ^= view[:, :, 1, :]
+    return words
+
+
+def encode_blocks(info_bits, block_length, info_set):
+    """Encoding polar untuk banyak codeword sekaligus.
+
+    Args:
+        info_bits (np.ndarray): Array (jumlah_codeword, K) berisi bit informasi.
+        block_length (int): Panjang blok N = 2^n.
+        info_set (np.ndarray): K indeks bit-channel yang membawa informasi;
+            sisanya frozen (bernilai 0).
+
+    Returns:
+        np.ndarray: Array uint8 (jumlah_codeword, N) berisi codeword.
+    """
+    info_bits = np.asarray(info_bits, dtype=np.uint8)
+    if info_bits.shape[1] != len(info_set):
+        raise ValueError("Jumlah kolom info_bits harus sama dengan ukuran information set.")
+    u = np.zeros((info_bits.shape[0], block_length), dtype=np.uint8)
+    u[:, info_set] = info_bits
+    return polar_transform(u)
+
+
+def num_blocks(num_bits, info_size):
+    """Jumlah codeword yang dibutuhkan untuk `num_bits` bit informasi."""
+    return -(-int(num_bits) // info_size)
+
+
+def crc_width(crc_poly):
+    """Panjang CRC (derajat polinom), 0 jika CRC tidak dipakai."""
+    return 0 if crc_poly is None else int(crc_poly).bit_length() - 1
+
+
+@functools.lru_cache(maxsize=None)
+def crc_matrix(num_bits, crc_poly):
+    """Matriks GF(2) (num_bits, width) sehingga CRC = bits @ M mod 2.
+
+    CRC dengan register awal nol bersifat linier, sehingga cukup dihitung
+    sisa pembagian x^(width + derajat) untuk setiap posisi bit (MSB dulu).
+    """
+    width = crc_width(crc_poly)
+    low = crc_poly ^ (1 << width)
+    remainders = np.empty(num_bits, dtype=np.int64)
+    r = low
+    for i in range(num_bits - 1, -1, -1):
+        remainders[i] = r
+        r <<= 1
+        if r >> width:
+            r = (r ^ crc_poly) & ((1 << width) - 1)
+    shifts = np.arange(width - 1, -1, -1)
+    matrix = ((remainders[:, None] >> shifts) & 1).astype(np.int32)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def crc_bits(data_bits, crc_poly):
+    """CRC untuk setiap baris `data_bits` (..., num_bits), hasil bit MSB dulu."""
+    data_bits = np.asarray(data_bits, dtype=np.uint8)
+    matrix = crc_matrix(data_bits.shape[-1], crc_poly)
+    return ((data_bits.astype(np.int32) @ matrix) & 1).astype(np.uint8)
+
+
+def encode(bits, block_length, info_set, crc_poly=None):
+    """Encoding aliran bit 1-D: dipotong per K bit (sisa dipad nol) lalu di-encode per blok.
+
+    Jika `crc_poly` diberikan, setiap blok membawa K - width bit data diikuti
+    CRC-nya, untuk dipakai oleh dekoder list (`scl_decode_blocks`).
+    """
+    bits = np.asarray(bits, dtype=np.uint8).ravel()
+    payload_size = len(info_set) - crc_width(crc_poly)
+    blocks = num_blocks(bits.size, payload_size)
+    padded = np.zeros(blocks * payload_size, dtype=np.uint8)
+    padded[: bits.size] = bits
+    info_bits = padded.reshape(blocks, payload_size)
+    if crc_poly is not None:
+        info_bits = np.concatenate([info_bits, crc_bits(info_bits, crc_poly)], axis=1)
+    return encode_blocks(info_bits, block_length, info_set).ravel()
+
+
+@functools.lru_cache(maxsize=None)
+def crc_byte_table(crc_poly):
+    """Tabel 256 entri CRC per byte (MSB dulu, register awal nol); width >= 8."""
+    width = crc_width(crc_poly)
+    table = np.zeros(256, dtype=np.uint32)
+    for byte in range(256):
+        r = byte << (width - 8)
+        for _ in range(8):
+            r <<= 1
+            if r >> width:
+                r ^= crc_poly
+        table[byte] = r
+    table.flags.writeable = False
+    return table
+
+
+def crc_packed(data_bytes, crc_poly):
+    """CRC untuk setiap baris `data_bytes` (jumlah_blok, byte) sekaligus.
+
+    Hasil sama dengan `crc_bits` pada bit yang di-unpack, tetapi diproses per
+    byte dengan tabel, lalu dikembalikan sebagai byte big-endian.
+    """
+    width = crc_width(crc_poly)
+    table = crc_byte_table(crc_poly)
+    register_mask = np.uint32((1 << width) - 1)
+    register = np.zeros(data_bytes.shape[0], dtype=np.uint32)
+    for column in data_bytes.T:
+        index = ((register >> np.uint32(width - 8)) ^ column) & np.uint32(0xFF)
+        register = ((register << np.uint32(8)) & register_mask) ^ table[index]
+    shifts = np.arange(width - 8, -1, -8, dtype=np.uint32)
+    return ((register[:, None] >> shifts) & np.uint32(0xFF)).astype(np.uint8)
+
+
+def _scatter_info_packed(info_packed, block_length, info_set):
+    """Menyisipkan bit informasi ter-pack ke posisi `info_set`; posisi frozen tetap 0.
+
+    Untuk setiap dari 8 posisi bit dalam byte codeword, bit sumber diambil
+    dengan gather pada byte informasi, sehingga tidak ada array satu-byte-per-bit.
+    """
+    num_words = info_packed.shape[0]
+    rank = np.full(block_length, -1, dtype=np.intp)
+    rank[info_set] = np.arange(len(info_set))
+    u = np.zeros((num_words, block_length // 8), dtype=np.uint8)
+    for bit in range(8):
+        source = rank[bit::8]
+        valid = np.flatnonzero(source >= 0)
+        source = source[valid]
+        shifts = (7 - source % 8).astype(np.uint8)
+        bits = (info_packed[:, source // 8] >> shifts) & 1
+        u[:, valid] |= bits << np.uint8(7 - bit)
+    return u
+
+
+def encode_packed(payload, num_bits, block_length, info_set, crc_poly=None, batch_size=4096):
+    """Encoding polar dari payload ter-pack langsung ke codeword ter-pack.
+
+    Setara dengan `np.packbits(encode(np.unpackbits(payload)[:num_bits], ...))`.
+    Jika panjang data per blok (K - width CRC) kelipatan 8 dan N >= 8, bit
+    tidak pernah dibongkar: blok diambil sebagai irisan byte, CRC dihitung
+    dengan tabel byte, dan butterfly berjalan pada byte/uint64. Selain itu
+    blok diproses per batch dengan jalur bit biasa.
+
+    Returns:
+        np.ndarray: Array uint8 berisi ceil(jumlah_blok * N / 8) byte codeword.
+    """
+    payload = np.array(np.ravel(payload)[: -(-num_bits // 8)], dtype=np.uint8)
+    if num_bits % 8:
+        # Bit sisa di byte terakhir diperlakukan sebagai padding nol.
+        payload[-1] &= np.uint8((0xFF << (8 - num_bits % 8)) & 0xFF)
+    payload_size = len(info_set) - crc_width(crc_poly)
+    blocks = num_blocks(num_bits, payload_size)
+    packed_path = payload_size % 8 == 0 and block_length >= 8
+    if crc_poly is not None and crc_width(crc_poly) % 8:
+        packed_path = False
+
+    out = np.empty(-(-blocks * block_length // 8), dtype=np.uint8)
+    batch_size = max(8, batch_size - batch_size % 8)
+    for start in range(0, blocks, batch_size):
+        stop = min(blocks, start + batch_size)
+        if packed_path:
+            step = payload_size // 8
+            data = np.zeros((stop - start, step), dtype=np.uint8)
+            chunk = payload[start * step : stop * step]
+            data.ravel()[: chunk.size] = chunk
+            if crc_poly is not None:
+                data = np.concatenate([data, crc_packed(data, crc_poly)], axis=1)
+            codewords = polar_transform_packed(_scatter_info_packed(data, block_length, info_set))
+            out[start * block_length // 8 : stop * block_length // 8] = codewords.ravel()
+        else:
+            bit_start, bit_stop = start * payload_size, min(num_bits, stop * payload_size)
+            bits = np.unpackbits(payload[bit_start // 8 : -(-bit_stop // 8)])
+            bits = bits[bit_start % 8 : bit_start % 8 + bit_stop - bit_start]
+            # `start` kelipatan 8 blok, sehingga batch selalu berawal di batas byte.
+            packed = np.packbits(encode(bits, block_length, info_set, crc_poly))
+            out[start * block_length // 8 : start * block_length // 8 + packed.size] = packed
+    return out
+
+
+def hard_to_llr(bits, crossover=0.05):
+    """LLR kanal BSC untuk bit keras: bit 0 -> +c, bit 1 -> -c, c = log((1-p)/p)."""
+    magnitude = np.float32(np.log((1 - crossover) / crossover))
+    bits = np.asarray(bits, dtype=np.uint8)
+    return magnitude - 2 * magnitude * bits.astype(np.float32)
+
+
+def _sc_node(alpha, beta, u_hat, info_prefix, length, lo):
+    """Satu node pohon SC; LLR di alpha[:, m:2m], partial sum di beta[:, m:2m]."""
+    llr = alpha[:, length : 2 * length]
+    x = beta[:, length : 2 * length]
+    info_count = info_prefix[lo + length] - info_prefix[lo]
+
+    if info_count == 0:
+        x[:] = 0
+        return
+    if info_count == length:
+        # Node rate-1: keputusan keras langsung, u = x G^{-1} = x G.
+        np.less(llr, 0, out=x, casting="unsafe")
+        u = x.copy()
+        if length > 1:
+            polar_transform(u)
+        u_hat[:, lo : lo + length] = u
+        return
+
+    half = length // 2
+    left, right = llr[:, :half], llr[:, half:]
+    child = alpha[:, half:length]
+
+    # f (min-sum): sign(a) sign(b) min(|a|, |b|)
+    np.minimum(np.abs(left), np.abs(right), out=child)
+    np.copysign(child, left * right, out=child)
+    _sc_node(alpha, beta, u_hat, info_prefix, half, lo)
+    x[:, :half] = beta[:, half:length]
+
+    # g: b + (1 - 2 s) a
+    flip = x[:, :half].astype(bool)
+    np.subtract(right, left, out=child, where=flip)
+    np.add(right, left, out=child, where=~flip)
+    _sc_node(alpha, beta, u_hat, info_prefix, half, lo + half)
+    partial = beta[:, half:length]
+    x[:, half:] = partial
+    x[:, :half] ^= partial
+
+
+def sc_decode_blocks(llr, info_set):
+    """Dekoder successive-cancellation (min-sum) untuk banyak codeword sekaligus.
+
+    Semua operasi f/g divektorisasi pada dimensi batch. Setiap codeword
+    memakai buffer LLR dan partial sum berukuran 2N yang dipakai ulang
+    in-place di setiap level pohon. Subpohon frozen semua (rate-0) dan
+    informasi semua (rate-1) diselesaikan langsung tanpa turun ke daun.
+
+    Args:
+        llr (np.ndarray): Array (jumlah_codeword, N) berisi LLR kanal
+            (positif berarti bit 0 lebih mungkin).
+        info_set (np.ndarray): Indeks bit-channel informasi.
+
+    Returns:
+        np.ndarray: Array uint8 (jumlah_codeword, K) berisi estimasi bit informasi.
+    """
+    llr = np.asarray(llr, dtype=np.float32)
+    num_words, block_length = llr.shape
+    check_block_length(block_length)
+
+    info_mask = np.zeros(block_length, dtype=bool)
+    info_mask[info_set] = True
+    info_prefix = np.concatenate([[0], np.cumsum(info_mask)])
+
+    alpha = np.empty((num_words, 2 * block_length), dtype=np.float32)
+    alpha[:, block_length:] = llr
+    beta = np.empty((num_words, 2 * block_length), dtype=np.uint8)
+    u_hat = np.zeros((num_words, block_length), dtype=np.uint8)
+
+    _sc_node(alpha, beta, u_hat, info_prefix, block_length, 0)
+    return u_hat[:, info_set]
+
+
+class _PathMemory:
+    """Memori jalur SCL: satu slot per jalur di setiap layer, dibagi lewat pointer.
+
+    Layer `lam` menyimpan LLR (`alpha`) dan partial sum (`beta`) sepanjang
+    2^lam untuk L slot per codeword. `ptr[lam]` (jumlah_codeword, L)
+    memetakan jalur ke slot yang dibacanya; `None` berarti identitas.
+    Saat jalur diduplikasi atau dipangkas, hanya tabel pointer yang
+    dipermutasi (copy-on-write malas): slot yang sama dirujuk oleh beberapa
+    jalur (jumlah rujukannya = banyak jalur yang menunjuknya) sampai layer
+    itu ditulis ulang. Penulisan selalu dilakukan untuk semua jalur sekaligus
+    dari hasil gather, sehingga slot yang masih dirujuk tidak pernah
+    tertimpa sebelum dibaca, dan pointer layer itu kembali ke identitas.
+    """
+
+    def __init__(self, llr, list_size):
+        num_words, block_length = llr.shape
+        depth = check_block_length(block_length)
+        self.rows = np.arange(num_words)[:, None]
+        self.alpha = [np.empty((num_words, list_size, 1 << lam), np.float32) for lam in range(depth)]
+        self.alpha.append(llr[:, None, :])
+        self.beta = [np.empty((num_words, list_size, 1 << lam), np.uint8) for lam in range(depth + 1)]
+        self.alpha_ptr = [None] * depth + [np.zeros((num_words, list_size), np.intp)]
+        self.beta_ptr = [None] * (depth + 1)
+
+    def read(self, arrays, pointers, lam):
+        if pointers[lam] is None:
+            return arrays[lam]
+        return arrays[lam][self.rows, pointers[lam]]
+
+    def read_alpha(self, lam):
+        return self.read(self.alpha, self.alpha_ptr, lam)
+
+    def read_beta(self, lam):
+        return self.read(self.beta, self.beta_ptr, lam)
+
+    def fork(self, survivors):
+        """Jalur ke-l kini melanjutkan jalur `survivors[:, l]`; tanpa menyalin data."""
+        for pointers in (self.alpha_ptr, self.beta_ptr):
+            for lam, ptr in enumerate(pointers):
+                if ptr is None:
+                    pointers[lam] = survivors
+                else:
+                    pointers[lam] = np.take_along_axis(ptr, survivors, axis=1)
+
+
+def _scl_node(mem, metric, info_prefix, lam, lo):
+    """Satu node pohon SCL; `metric` (jumlah_codeword, L) diperbarui in-place."""
+    length = 1 << lam
+    info_count = info_prefix[lo + length] - info_prefix[lo]
+
+    if info_count == 0:
+        # Subpohon frozen: penalti path metric langsung dari LLR node.
+        llr = mem.read_alpha(lam)
+        metric += np.maximum(-llr, 0).sum(axis=2)
+        mem.beta[lam][:] = 0
+        mem.beta_ptr[lam] = None
+        return
+
+    if lam == 0:
+        llr = mem.read_alpha(0)[:, :, 0]
+        list_size = metric.shape[1]
+        candidates = np.concatenate(
+            [metric + np.maximum(-llr, 0), metric + np.maximum(llr, 0)], axis=1
+        )
+        keep = np.argpartition(candidates, list_size - 1, axis=1)[:, :list_size]
+        metric[:] = np.take_along_axis(candidates, keep, axis=1)
+        mem.fork(keep % list_size)
+        mem.beta[0][:, :, 0] = keep // list_size
+        mem.beta_ptr[0] = None
+        return
+
+    half = length // 2
+    llr = mem.read_alpha(lam)
+    left, right = llr[:, :, :half], llr[:, :, half:]
+    child = mem.alpha[lam - 1]
+    np.minimum(np.abs(left), np.abs(right), out=child)
+    np.copysign(child, left * right, out=child)
+    mem.alpha_ptr[lam - 1] = None
+    _scl_node(mem, metric, info_prefix, lam - 1, lo)
+
+    mem.beta[lam][:, :, :half] = mem.read_beta(lam - 1)
+    mem.beta_ptr[lam] = None
+    llr = mem.read_alpha(lam)
+    left, right = llr[:, :, :half], llr[:, :, half:]
+    flip = mem.beta[lam][:, :, :half].astype(bool)
+    np.subtract(right, left, out=child, where=flip)
+    np.add(right, left, out=child, where=~flip)
+    mem.alpha_ptr[lam - 1] = None
+    _scl_node(mem, metric, info_prefix, lam - 1, lo + half)
+
+    upper = mem.read_beta(lam)[:, :, :half]
+    partial = mem.read_beta(lam - 1)
+    mem.beta[lam][:, :, :half] = upper ^ partial
+    mem.beta[lam][:, :, half:] = partial
+    mem.beta_ptr[lam] = None
+
+
+def scl_decode_blocks(llr, info_set, list_size=8, crc_poly=None):
+    """Dekoder successive-cancellation list (CA-SCL) untuk banyak codeword sekaligus.
+
+    Setiap codeword membawa `list_size` jalur dengan path metric min-sum.
+    Pada setiap bit informasi, 2L kandidat dipangkas kembali ke L dengan
+    `np.argpartition` (partial sort tervektorisasi). Duplikasi jalur hanya
+    mempermutasi tabel pointer (lihat `_PathMemory`), sehingga memori tetap
+    O(L N) per codeword. Di akhir, jalur dengan CRC valid dan metric terkecil
+    dipilih; jika tidak ada yang valid, dipilih metric terkecil.
+
+    Args:
+        llr (np.ndarray): Array (jumlah_codeword, N) berisi LLR kanal.
+        info_set (np.ndarray): Indeks bit-channel informasi (K).
+        list_size (int): Ukuran list L.
+        crc_poly (int | None): Polinom CRC yang ditempel encoder.
+
+    Returns:
+        tuple: (bit informasi uint8 (jumlah_codeword, K), flag CRC valid
+        bool (jumlah_codeword,); selalu True jika CRC tidak dipakai).
+    """
+    llr = np.asarray(llr, dtype=np.float32)
+    num_words, block_length = llr.shape
+    depth = check_block_length(block_length)
+
+    info_mask = np.zeros(block_length, dtype=bool)
+    info_mask[info_set] = True
+    info_prefix = np.concatenate([[0], np.cumsum(info_mask)])
+
+    mem = _PathMemory(llr, list_size)
+    metric = np.full((num_words, list_size), np.inf, dtype=np.float32)
+    metric[:, 0] = 0
+    _scl_node(mem, metric, info_prefix, depth, 0)
+
+    x = np.ascontiguousarray(mem.read_beta(depth)).reshape(-1, block_length)
+    info = polar_transform(x)[:, info_set].reshape(num_words, list_size, -1)
+
+    if crc_poly is None:
+        crc_ok = np.ones(metric.shape, dtype=bool)
+    else:
+        width = crc_width(crc_poly)
+        data, check = info[:, :, :-width], info[:, :, -width:]
+        crc_ok = (crc_bits(data, crc_poly) == check).all(axis=2)
+
+    ranked = np.where(crc_ok, metric, np.inf)
+    ranked = np.where(np.isfinite(ranked).any(axis=1, keepdims=True), ranked, metric)
+    best = np.argmin(ranked, axis=1)
+    rows = np.arange(num_words)
+    return info[rows, best], crc_ok[rows, best]
+
+
+def decode(
+    llr, num_bits, block_length, info_set, list_size=1, crc_poly=None, batch_size=4096
+):
+    """Dekode aliran LLR 1-D; codeword diproses per batch.
+
+    `list_size` = 1 tanpa CRC memakai dekoder SC; selain itu dipakai CA-SCL
+    dan ukuran batch dibagi `list_size` agar memori tetap terbatas.
+    """
+    llr = np.asarray(llr, dtype=np.float32).ravel()
+    payload_size = len(info_set) - crc_width(crc_poly)
+    blocks = num_blocks(num_bits, payload_size)
+    llr = llr[: blocks * block_length].reshape(blocks, block_length)
+
+    use_list = list_size > 1 or crc_poly is not None
+    step = max(1, batch_size // list_size)
+    decoded = np.empty((blocks, payload_size), dtype=np.uint8)
+    for start in range(0, blocks, step):
+        chunk = llr[start : start + step]
+        if use_list:
+            info, _ = scl_decode_blocks(chunk, info_set, list_size, crc_poly)
+        else:
+            info = sc_decode_blocks(chunk, info_set)
+        decoded[start : start + step] = info[:, :payload_size]
+    return decoded.ravel()[:num_bits]
+
+
+def decode_packed(
+    codeword_bytes,
+    num_bits,
+    block_length,
+    info_set,
+    list_size=1,
+    crc_poly=None,
+    crossover=0.05,
+    batch_size=4096,
+):
+    """Dekode codeword ter-pack hasil ekstraksi langsung menjadi payload ter-pack.
+
+    Bit codeword dibongkar dan diubah menjadi LLR hanya untuk satu batch blok
+    pada satu waktu, sehingga memori puncak sebanding dengan payload dan
+    ukuran batch, bukan 32x payload seperti LLR float32 untuk seluruh aliran.
+    """
+    codeword_bytes = np.ascontiguousarray(codeword_bytes, dtype=np.uint8).ravel()
+    payload_size = len(info_set) - crc_width(crc_poly)
+    blocks = num_blocks(num_bits, payload_size)
+    use_list = list_size > 1 or crc_poly is not None
+    step = max(8, (batch_size // list_size) // 8 * 8)
+
+    out = np.zeros(-(-num_bits // 8), dtype=np.uint8)
+    for start in range(0, blocks, step):
+        stop = min(blocks, start + step)
+        chunk = codeword_bytes[start * block_length // 8 : -(-stop * block_length // 8)]
+        bits = np.unpackbits(chunk)[: (stop - start) * block_length]
+        llr = hard_to_llr(bits, crossover).reshape(stop - start, block_length)
+        if use_list:
+            info, _ = scl_decode_blocks(llr, info_set, list_size, crc_poly)
+        else:
+            info = sc_decode_blocks(llr, info_set)
+        bits = info[:, :payload_size].ravel()
+        bit_start = start * payload_size
+        bits = bits[: max(0, num_bits - bit_start)]
+        # `step` kelipatan 8, sehingga setiap batch berawal di batas byte.
+        packed = np.packbits(bits)
+        out[bit_start // 8 : bit_start // 8 + packed.size] = packed
+    return out
@@ -0,0 +1,325 @@
+import numpy as np
+
+from .distortion import DistortionTracker
+from .lsb import (
+    carrier_segments,
+    embed_payload,
+    embed_payload_selected,
+    embed_symbols,
+    extract_payload,
+    extract_payload_selected,
+    lsb_mask,
+    pack_symbols_into,
+    symbol_count,
+    symbols_at,
+)
+from .polar import (
+    crc_width,
+    decode,
+    decode_packed,
+    encode,
+    encode_packed,
+    hard_to_llr,
+    num_blocks,
+)
+from .polar_construction import info_set
+from .result_cache import memoize
+from .selection import DEFAULT_KEY, selection_chunks
+from .tiles import (
+    TILE_PIXELS,
+    band_segments,
+    create_output,
+    load_band,
+    open_cover,
+    row_bands,
+    stego_shape,
+)
+
+
+POLAR_BLOCK_LENGTH = 1024
+POLAR_INFO_SIZE = 512
+POLAR_DESIGN_SNR_DB = 0.0
+POLAR_CONSTRUCTION = "bhattacharyya"  # atau "gaussian"
+POLAR_LIST_SIZE = 1
+POLAR_CRC_POLY = None  # mis. CRC16_CCITT untuk CA-SCL
+
+
+def polar_info_set(block_length=POLAR_BLOCK_LENGTH, info_size=POLAR_INFO_SIZE):
+    """Information set Polar Code dari cache konstruksi (lihat `polar_construction`)."""
+    return info_set(block_length, info_size, POLAR_DESIGN_SNR_DB, POLAR_CONSTRUCTION)
+
+
+def polar_encode(
+    data, block_length=POLAR_BLOCK_LENGTH, info_size=POLAR_INFO_SIZE, crc_poly=POLAR_CRC_POLY
+):
+    """Encoding Polar Code (Arikan) untuk aliran bit secret, dipotong per `info_size` bit."""
+    return encode(data, block_length, polar_info_set(block_length, info_size), crc_poly)
+
+
+def polar_decode(
+    data,
+    num_bits=None,
+    block_length=POLAR_BLOCK_LENGTH,
+    info_size=POLAR_INFO_SIZE,
+    llr=None,
+    list_size=POLAR_LIST_SIZE,
+    crc_poly=POLAR_CRC_POLY,
+):
+    """Dekode Polar Code dengan successive cancellation (list).
+
+    `data` adalah bit hasil ekstraksi; jika `llr` diberikan (mis. dari kanal
+    lunak), LLR tersebut dipakai langsung sebagai masukan dekoder. Dengan
+    `list_size` > 1 atau `crc_poly` dipakai dekoder CA-SCL. `num_bits` = None
+    (pemanggilan awal `polar_decode(data)`) mengembalikan semua bit informasi
+    dari `len(data) // block_length` blok, termasuk padding blok terakhir.
+    """
+    if llr is None:
+        llr = hard_to_llr(data)
+    if num_bits is None:
+        num_bits = (np.size(llr) // block_length) * (info_size - crc_width(crc_poly))
+    info_set = polar_info_set(block_length, info_size)
+    return decode(llr, num_bits, block_length, info_set, list_size, crc_poly)
+
+
+def polar_encoded_size(
+    num_bits, block_length=POLAR_BLOCK_LENGTH, info_size=POLAR_INFO_SIZE, crc_poly=POLAR_CRC_POLY
+):
+    """Jumlah byte hasil encoding Polar Code untuk `num_bits` bit secret."""
+    payload_size = info_size - crc_width(crc_poly)
+    return -(-num_blocks(num_bits, payload_size) * block_length // 8)
+
+
+def _encode_secret(secret_img, carrier_size, num_lsb, crc_poly, info_size=POLAR_INFO_SIZE):
+    """Encoding Polar Code atas secret image, lengkap dengan pemeriksaan kapasitas.
+
+    Byte secret langsung menjadi payload ter-pack untuk encoder, dan hasilnya
+    juga ter-pack; bit tidak pernah disimpan satu byte per bit.
+    """
+    secret_bytes = np.ascontiguousarray(secret_img, dtype=np.uint8).ravel()
+    num_bits = secret_bytes.size * 8
+
+    max_capacity = (carrier_size * num_lsb) // 8
+    if polar_encoded_size(num_bits, info_size=info_size, crc_poly=crc_poly) > max_capacity:
+        raise ValueError("Secret image terlalu besar untuk di-embed dalam host image.")
+
+    info_set = polar_info_set(info_size=info_size)
+    return encode_packed(secret_bytes, num_bits, POLAR_BLOCK_LENGTH, info_set, crc_poly)
+
+
+def _decode_secret(encoded_bytes, secret_shape, list_size, crc_poly, info_size=POLAR_INFO_SIZE):
+    """Men-decode byte codeword ter-pack hasil ekstraksi menjadi secret image."""
+    num_bits = int(np.prod(secret_shape)) * 8
+    decoded = decode_packed(
+        encoded_bytes,
+        num_bits,
+        POLAR_BLOCK_LENGTH,
+        polar_info_set(info_size=info_size),
+        list_size,
+        crc_poly,
+    )
+    return decoded.reshape(secret_shape)
+
+
+def _encoded_size(secret_shape, crc_poly, info_size=POLAR_INFO_SIZE):
+    """Jumlah byte codeword untuk secret berbentuk `secret_shape`."""
+    return polar_encoded_size(
+        int(np.prod(secret_shape)) * 8, info_size=info_size, crc_poly=crc_poly
+    )
+
+
+def embed_image(
+    host_img,
+    secret_img,
+    num_lsb=2,
+    crc_poly=POLAR_CRC_POLY,
+    layout=None,
+    selection=None,
+    key=DEFAULT_KEY,
+    min_psnr=None,
+    return_distortion=False,
+    info_size=POLAR_INFO_SIZE,
+):
+    """Menyisipkan secret image menggunakan Multiple LSB.
+
+    Dengan `layout` = None host dikonversi ke grayscale (perilaku awal).
+    Dengan "interleaved" atau "planar" ketiga kanal RGB dipakai langsung
+    sebagai satu buffer pembawa, sehingga kapasitasnya tiga kali lipat.
+    Secara default simbol ditulis berurutan; `selection` = "global" atau
+    "tiled" menyebarnya ke sampel yang dipilih dengan `key` (lihat modul
+    `selection`), dan ekstraksi harus memakai nilai yang sama.
+
+    Galat kuadrat terhadap pembawa (host grayscale bila `layout` None)
+    dijumlahkan saat menulis. Dengan `return_distortion` hasilnya
+    (stego, ringkasan `DistortionTracker.summary`) berisi MSE dan PSNR
+    tanpa membandingkan ulang gambar; dengan `min_psnr` penyisipan berhenti
+    dengan `DistortionBudgetExceeded` begitu PSNR pasti di bawah batas itu.
+    `info_size` (K bit informasi per blok N = `POLAR_BLOCK_LENGTH`) menentukan
+    laju kode dan harus sama saat ekstraksi.
+    """
+    if layout is None:
+        import cv2
+
+        stego = cv2.cvtColor(host_img, cv2.COLOR_BGR2GRAY)
+    else:
+        stego = np.array(host_img, order="C", copy=True)
+    segments = carrier_segments(stego, layout)
+    carrier_size = sum(segment.size for segment in segments)
+    encoded_data = _encode_secret(secret_img, carrier_size, num_lsb, crc_poly, info_size)
+    tracker = None
+    if return_distortion or min_psnr is not None:
+        tracker = DistortionTracker(carrier_size, min_psnr)
+    if selection is None:
+        embed_payload(segments, encoded_data, num_lsb, tracker=tracker)
+    else:
+        total = symbol_count(encoded_data.size, num_lsb)
+        chunks = selection_chunks(total, carrier_size, key, selection)
+        embed_payload_selected(stego, encoded_data, num_lsb, chunks, layout, tracker)
+    if return_distortion:
+        return stego, tracker.summary()
+    return stego
+
+
+def extract_image(
+    embedded_img,
+    secret_shape,
+    num_lsb=2,
+    list_size=POLAR_LIST_SIZE,
+    crc_poly=POLAR_CRC_POLY,
+    layout=None,
+    selection=None,
+    key=DEFAULT_KEY,
+    info_size=POLAR_INFO_SIZE,
+):
+    """Ekstraksi gambar yang telah disisipkan (`layout`, `selection`, `key`, dan
+    `info_size` sama dengan saat embedding)."""
+    carrier = np.ascontiguousarray(embedded_img)
+    num_bytes = _encoded_size(secret_shape, crc_poly, info_size)
+    if selection is None:
+        encoded_data = extract_payload(carrier_segments(carrier, layout), num_bytes, num_lsb)
+    else:
+        total = symbol_count(num_bytes, num_lsb)
+        chunks = selection_chunks(total, carrier.size, key, selection)
+        encoded_data = extract_payload_selected(carrier, num_bytes, num_lsb, chunks, layout)
+    return _decode_secret(encoded_data, secret_shape, list_size, crc_poly, info_size)
+
+
+def extract_image_cached(
+    embedded_img,
+    secret_shape,
+    num_lsb=2,
+    list_size=POLAR_LIST_SIZE,
+    crc_poly=POLAR_CRC_POLY,
+    layout=None,
+    selection=None,
+    key=DEFAULT_KEY,
+    cache=None,
+    info_size=POLAR_INFO_SIZE,
+):
+    """`extract_image` dengan cache berbasis hash isi stego image (lihat `result_cache`).
+
+    Parameter kode Polar ikut menjadi bagian kunci, sehingga mengubah salah
+    satunya tidak pernah mengembalikan hasil lama.
+    """
+    params = {
+        "secret_shape": list(secret_shape),
+        "num_lsb": num_lsb,
+        "list_size": list_size,
+        "crc_poly": crc_poly,
+        "layout": layout,
+        "selection": selection,
+        "key": key,
+        "code": [POLAR_BLOCK_LENGTH, info_size, POLAR_DESIGN_SNR_DB, POLAR_CONSTRUCTION],
+    }
+    return memoize(
+        "extract_image",
+        [embedded_img],
+        params,
+        lambda: extract_image(
+            embedded_img,
+            secret_shape,
+            num_lsb,
+            list_size,
+            crc_poly,
+            layout,
+            selection,
+            key,
+            info_size,
+        ),
+        cache,
+    )
+
+
+def embed_image_tiled(
+    cover_path,
+    stego_path,
+    secret_img,
+    num_lsb=2,
+    crc_poly=POLAR_CRC_POLY,
+    layout=None,
+    shape=None,
+    tile_pixels=TILE_PIXELS,
+    min_psnr=None,
+    return_distortion=False,
+    info_size=POLAR_INFO_SIZE,
+):
+    """Versi ber-tile dari `embed_image` untuk cover `.npy`/raw yang sangat besar.
+
+    Cover dibuka sebagai memmap dan diproses per band baris berisi sekitar
+    `tile_pixels` piksel; setiap band dikonversi (jika grayscale), disisipi,
+    lalu ditulis ke `stego_path`. Memori puncak sebanding dengan ukuran tile
+    dan payload, bukan ukuran cover, dan hasilnya identik bit demi bit
+    dengan `embed_image`. `min_psnr`, `return_distortion`, dan `info_size`
+    sama dengan `embed_image`; jika anggaran terlampaui, file stego hanya terisi sebagian.
+
+    Returns:
+        tuple: Bentuk stego image yang ditulis, atau (bentuk, distorsi)
+        dengan `return_distortion`.
+    """
+    cover = open_cover(cover_path, shape)
+    out_shape = stego_shape(cover.shape, layout)
+    encoded_data = _encode_secret(
+        secret_img, int(np.prod(out_shape)), num_lsb, crc_poly, info_size
+    )
+    total_symbols = symbol_count(encoded_data.size, num_lsb)
+    tracker = None
+    if return_distortion or min_psnr is not None:
+        tracker = DistortionTracker(int(np.prod(out_shape)), min_psnr)
+
+    stego = create_output(stego_path, out_shape)
+    for r0, r1 in row_bands(out_shape, tile_pixels):
+        band = load_band(cover, r0, r1, layout)
+        for offset, segment in band_segments(band, r0, out_shape, layout):
+            if offset < total_symbols:
+                symbols = symbols_at(encoded_data, offset, segment.size, num_lsb)
+                embed_symbols(segment, symbols, num_lsb, tracker)
+        stego[r0:r1] = band
+    stego.flush()
+    if return_distortion:
+        return out_shape, tracker.summary()
+    return out_shape
+
+
+def extract_image_tiled(
+    stego_path,
+    secret_shape,
+    num_lsb=2,
+    list_size=POLAR_LIST_SIZE,
+    crc_poly=POLAR_CRC_POLY,
+    layout=None,
+    shape=None,
+    tile_pixels=TILE_PIXELS,
+    info_size=POLAR_INFO_SIZE,
+):
+    """Versi ber-tile dari `extract_image`: stego dibaca per band lewat memmap."""
+    stego = open_cover(stego_path, shape)
+    encoded_data = np.zeros(_encoded_size(secret_shape, crc_poly, info_size), dtype=np.uint8)
+    num_symbols = symbol_count(encoded_data.size, num_lsb)
+    mask = np.uint8(lsb_mask(num_lsb))
+
+    for r0, r1 in row_bands(stego.shape, tile_pixels):
+        band = np.asarray(stego[r0:r1])
+        for offset, segment in band_segments(band, r0, stego.shape, layout):
+            count = min(segment.size, num_symbols - offset)
+            if count > 0:
+                pack_symbols_into(encoded_data, offset, segment[:count] & mask, num_lsb)
+    return _decode_secret(encoded_data, secret_shape, list_size, crc_poly, info_size)
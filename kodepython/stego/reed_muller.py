@@ -0,0 +1,436 @@
+import functools
+import itertools
+
+import numpy as np
+
+from .distortion import DistortionTracker
+from .lsb import carrier_flat_index
+from .reed_solomon import rs_decode_blocks, rs_encode_blocks
+from .selection import DEFAULT_KEY, selection_chunks
+
+# ===== Reed-Solomon Implementation for Image Steganography =====
+def reed_solomon_params(n=4, k=11):
+    """Block parameters of the Reed-Solomon code behind `reed_muller_encode`.
+
+    The secret is framed into `k`-byte message blocks (the last one
+    zero-padded), and each block becomes a `2**n`-byte systematic codeword
+    carrying `2**n - k` parity bytes, i.e. the shortened RS(2**n, k) code
+    over GF(256).
+    """
+    codeword_length = 2**n
+    if not 0 < k < codeword_length <= 255:
+        raise ValueError("Reed-Solomon block needs 0 < k < 2**n <= 255.")
+    return {
+        "codeword_length": codeword_length,
+        "message_length": k,
+        "parity_length": codeword_length - k,
+    }
+
+def encoded_block_size(n=4, k=11):
+    """Bytes written per codeword block (`2**n`)."""
+    return reed_solomon_params(n, k)["codeword_length"]
+
+def num_code_blocks(num_bytes, n=4, k=11):
+    """Number of `k`-byte message blocks needed for `num_bytes` secret bytes."""
+    return -(-int(num_bytes) // reed_solomon_params(n, k)["message_length"])
+
+def encoded_size(num_bytes, n=4, k=11):
+    """Bytes written to the carrier for `num_bytes` secret bytes."""
+    return num_code_blocks(num_bytes, n, k) * encoded_block_size(n, k)
+
+def reed_muller_encode(data, n=4, k=11):
+    """Simulates Reed-Muller Code encoding using Reed-Solomon.
+
+    All `k`-byte message blocks are encoded at once by `rs_encode_blocks`
+    into one preallocated (blocks x 2**n) buffer; the codewords match
+    `reedsolo.RSCodec(2**n - k)` block by block.
+    """
+    params = reed_solomon_params(n, k)
+    data = np.ascontiguousarray(data, dtype=np.uint8).reshape(-1)
+    num_blocks = num_code_blocks(data.size, n, k)
+    messages = np.zeros((num_blocks, k), dtype=np.uint8)
+    messages.reshape(-1)[: data.size] = data
+    encoded = np.empty((num_blocks, params["codeword_length"]), dtype=np.uint8)
+    rs_encode_blocks(messages, params["parity_length"], out=encoded)
+    return encoded.reshape(-1)
+
+def reed_muller_decode(data, n=4, k=11, workers=None, return_flags=False):
+    """Decodes binary data from Reed-Muller Code embedding.
+
+    Syndromes of all codewords are computed in one vectorized pass; only
+    blocks with a nonzero syndrome go through Berlekamp-Massey/Forney
+    correction (over `workers` processes if given). A block that cannot be
+    corrected keeps its received message bytes. With `return_flags` the
+    per-block success flags are returned as well.
+    """
+    params = reed_solomon_params(n, k)
+    block = params["codeword_length"]
+    data = np.ascontiguousarray(data, dtype=np.uint8).reshape(-1)
+    codewords = np.zeros((-(-data.size // block), block), dtype=np.uint8)
+    codewords.reshape(-1)[: data.size] = data
+    messages, ok = rs_decode_blocks(codewords, params["parity_length"], workers)
+    decoded_data = messages.reshape(-1)
+    if return_flags:
+        return decoded_data, ok
+    return decoded_data
+
+def embed_image_reed_muller(
+    host_img,
+    secret_img,
+    n=4,
+    k=11,
+    layout=None,
+    key=DEFAULT_KEY,
+    order="global",
+    min_psnr=None,
+    return_distortion=False,
+):
+    """Embeds secret image using Reed-Muller Code.
+
+    With `layout` None the host is converted to grayscale. With "interleaved"
+    or "planar" all three RGB channels are written in place as one carrier.
+    Carrier samples are chosen by the keyed Feistel stream in `selection`,
+    in "global" or cache-friendly "tiled" `order`; extraction must use the
+    same `key` and `order`.
+
+    The squared error against the carrier is accumulated while writing:
+    `return_distortion` returns (stego, distortion summary) with MSE and
+    PSNR, and `min_psnr` aborts with `DistortionBudgetExceeded` as soon as
+    the final PSNR is bound to fall below it.
+    """
+    if layout is None:
+        import cv2
+
+        stego = cv2.cvtColor(host_img, cv2.COLOR_BGR2GRAY)
+    else:
+        stego = np.array(host_img, order="C", copy=True)
+    secret_bin = secret_img.flatten()
+    encoded_data = reed_muller_encode(secret_bin, n, k)
+    
+    if len(encoded_data) > stego.size:
+        raise ValueError("Secret image too large to embed in host image.")
+        
+    tracker = None
+    if return_distortion or min_psnr is not None:
+        tracker = DistortionTracker(stego.size, min_psnr)
+    stego_flat = stego.reshape(-1)
+    for start, positions in selection_chunks(len(encoded_data), stego.size, key, order):
+        flat_index = carrier_flat_index(positions, stego.shape, layout)
+        block = encoded_data[start : start + positions.size]
+        if tracker is not None:
+            tracker.add(stego_flat[flat_index], block)
+        stego_flat[flat_index] = block
+    
+    if return_distortion:
+        return stego, tracker.summary()
+    return stego
+
+def extract_image_reed_muller(
+    embedded_img,
+    secret_shape,
+    n=4,
+    k=11,
+    layout=None,
+    key=DEFAULT_KEY,
+    order="global",
+    workers=None,
+    return_flags=False,
+):
+    """Extracts image embedded using Reed-Muller decoding.
+
+    With `return_flags` returns (image, block flags), where flag i tells
+    whether secret bytes [i*k, (i+1)*k) came from a clean or corrected block.
+    """
+    embedded_flat = np.ascontiguousarray(embedded_img).reshape(-1)
+    num_secret_bytes = int(np.prod(secret_shape))
+    expected_encoded_size = encoded_size(num_secret_bytes, n, k)
+    
+    extracted_bytes = np.empty(expected_encoded_size, dtype=np.uint8)
+    for start, positions in selection_chunks(
+        expected_encoded_size, embedded_flat.size, key, order
+    ):
+        flat_index = carrier_flat_index(positions, embedded_img.shape, layout)
+        extracted_bytes[start : start + positions.size] = embedded_flat[flat_index]
+    decoded_data, ok = reed_muller_decode(extracted_bytes, n, k, workers, return_flags=True)
+    
+    # Handle size mismatch
+    if decoded_data.size < num_secret_bytes:
+        decoded_data = np.pad(
+            decoded_data, (0, num_secret_bytes - decoded_data.size), mode="constant"
+        )
+    elif decoded_data.size > num_secret_bytes:
+        decoded_data = decoded_data[:num_secret_bytes]
+    
+    if return_flags:
+        return decoded_data.reshape(secret_shape), ok
+    return decoded_data.reshape(secret_shape)
+
+# ===== LSB Steganography Implementation =====
+def lsb_embed(cover_pixel, data_bit):
+    """Embeds a single bit in the least significant bit of a pixel."""
+    return (cover_pixel & ~1) | data_bit
+
+def lsb_extract(stego_pixel):
+    """Extracts the least significant bit from a pixel."""
+    return stego_pixel & 1
+
+# ===== Blum Blum Shub PRNG Implementation =====
+def blum_blum_shub(seed, length):
+    """
+    Generates a sequence of pseudorandom bits using the Blum-Blum-Shub algorithm.
+    
+    Args:
+        seed: The initial seed value
+        length: Number of bits to generate
+        
+    Returns:
+        A list of pseudorandom bits
+    """
+    p = 107  # Example prime number
+    q = 191  # Another example prime number
+    n = p * q
+    x = seed
+    result = []
+    
+    for _ in range(length):
+        x = (x * x) % n
+        result.append(x % 2)  # Take LSB
+        
+    return result
+
+# ===== Reed-Muller (1,m) Code Implementation =====
+# Up to this order all 2**(m+1) codewords are tabulated (2**(2m+1) bytes).
+RM1M_CODEBOOK_MAX_M = 8
+
+@functools.lru_cache(maxsize=None)
+def generator_matrix_rm1m(m):
+    """Generator matrix of RM(1, m) as a cached read-only (m + 1, 2**m) uint8 array.
+
+    Row 0 is all ones (overall parity); row i has bit (i - 1) of each column index.
+    """
+    columns = np.arange(2**m)
+    matrix = np.empty((m + 1, 2**m), dtype=np.uint8)
+    matrix[0] = 1
+    matrix[1:] = (columns >> np.arange(m)[:, None]) & 1
+    matrix.flags.writeable = False
+    return matrix
+
+@functools.lru_cache(maxsize=None)
+def codebook_rm1m(m):
+    """All RM(1, m) codewords, row u for the message whose bit i is a_i (read-only)."""
+    messages = (np.arange(2 ** (m + 1))[:, None] >> np.arange(m + 1)) & 1
+    codebook = _gf2_matmul(messages, generator_matrix_rm1m(m))
+    codebook.flags.writeable = False
+    return codebook
+
+def _gf2_matmul(a, b):
+    """GF(2) matrix product of 0/1 arrays; BLAS in float32 (sums of <= 2**24 ones are exact)."""
+    product = a.astype(np.float32) @ b.astype(np.float32)
+    return (product.astype(np.int32) & 1).astype(np.uint8)
+
+def generate_generator_matrix_rm1m(m):
+    """Generates generator matrix for RM(1, m)."""
+    return generator_matrix_rm1m(m).tolist()
+
+def encode_rm1m_batch(messages, m):
+    """Encodes a (words, m + 1) array of message bits with RM(1, m).
+
+    For m <= `RM1M_CODEBOOK_MAX_M` each codeword is one row lookup in
+    `codebook_rm1m` (built once with a GF(2) matrix product of all messages
+    and the cached generator matrix). Larger codes split column index j
+    into high and low bits: the codeword is the low-order RM(1, 8) codeword
+    of (a0, a1..a8), XORed block by block with the RM(1, m - 8) codeword of
+    (0, a9..am), so they are still built from codebook rows.
+
+    Returns:
+        np.ndarray: (words, 2**m) uint8 codewords.
+    """
+    messages = np.asarray(messages, dtype=np.uint8)
+    if messages.shape[-1] != m + 1:
+        raise ValueError("Message length must be equal to m + 1.")
+    messages = messages.reshape(-1, m + 1)
+    if m <= RM1M_CODEBOOK_MAX_M:
+        index = messages.astype(np.intp) @ (1 << np.arange(m + 1))
+        return codebook_rm1m(m)[index]
+    low_order = RM1M_CODEBOOK_MAX_M
+    low = encode_rm1m_batch(messages[:, : low_order + 1], low_order)
+    high_messages = np.zeros((messages.shape[0], m - low_order + 1), dtype=np.uint8)
+    high_messages[:, 1:] = messages[:, low_order + 1 :]
+    high = encode_rm1m_batch(high_messages, m - low_order)
+    return (high[:, :, None] ^ low[:, None, :]).reshape(messages.shape[0], 2**m)
+
+def encode_rm1m(message, m):
+    """Encodes a message using RM(1, m)."""
+    return encode_rm1m_batch(np.asarray([message]), m)[0].tolist()
+
+def hadamard_transform(values):
+    """Fast Walsh-Hadamard transform along the last axis (length 2**m).
+
+    Runs m vectorized butterfly stages over all rows at once, O(n log n) per
+    row; output index u holds sum_j values[j] * (-1)**popcount(u & j).
+    """
+    values = np.asarray(values)
+    n = values.shape[-1]
+    if n & (n - 1):
+        raise ValueError("Transform length must be a power of two.")
+    rows = values.reshape(-1, n)
+    h = 1
+    while h < n:
+        pairs = rows.reshape(rows.shape[0], -1, 2, h)
+        rows = np.stack(
+            (pairs[:, :, 0] + pairs[:, :, 1], pairs[:, :, 0] - pairs[:, :, 1]), axis=2
+        ).reshape(rows.shape[0], n)
+        h *= 2
+    return rows.reshape(values.shape)
+
+def decode_rm1m_batch(received, m, soft=False):
+    """Maximum-likelihood decoding of RM(1, m) words with the Hadamard transform.
+
+    Codeword bit j of message (a0, a1, ..., am) is a0 ^ (u . j) with
+    u = sum a_i 2**(i-1), so the correlation of the received word with every
+    codeword is +-H(y)[u] for y = (-1)**bits. Picking the largest |H(y)[u]|
+    is maximum-likelihood on a BSC (hard) and on an AWGN channel (soft).
+
+    Args:
+        received: (words, 2**m) array of hard bits (0/1), or of soft values
+            where positive means bit 0 (e.g. LLRs) if `soft` is True.
+        m: RM(1, m) order.
+        soft: Treat `received` as soft values.
+
+    Returns:
+        np.ndarray: (words, m + 1) uint8 messages [a0, a1, ..., am].
+    """
+    n = 2**m
+    received = np.asarray(received)
+    if received.shape[-1] != n:
+        raise ValueError("Received words must have length 2**m.")
+    received = received.reshape(-1, n)
+    if soft:
+        y = received.astype(np.float64)
+    else:
+        # +-1 correlations stay exact in int16/int32.
+        y = 1 - 2 * received.astype(np.int16 if n < 1 << 15 else np.int32)
+    spectrum = hadamard_transform(y)
+    u = np.argmax(np.abs(spectrum), axis=1)
+    messages = np.empty((received.shape[0], m + 1), dtype=np.uint8)
+    messages[:, 0] = spectrum[np.arange(u.size), u] < 0
+    messages[:, 1:] = (u[:, None] >> np.arange(m)) & 1
+    return messages
+
+def majority_decode_rm1m(received_word, m):
+    """Decodes one RM(1, m) word (maximum-likelihood via `decode_rm1m_batch`)."""
+    return decode_rm1m_batch(np.asarray([received_word]), m)[0].tolist()
+
+# ===== General Reed-Muller RM(r, m) Code =====
+# Words per decoding batch are chosen so check-sum gathers stay near this size.
+RM_DECODE_BATCH_BITS = 1 << 24
+
+@functools.lru_cache(maxsize=None)
+def rm_monomials(r, m):
+    """Monomial basis of RM(r, m): variable index tuples of degree 0..r.
+
+    Ordered by degree, then lexicographically, so RM(1, m) is
+    (), (0,), (1,), ..., (m - 1,) like `generator_matrix_rm1m`.
+    """
+    if not 0 <= r <= m:
+        raise ValueError("RM(r, m) needs 0 <= r <= m.")
+    return tuple(
+        monomial
+        for degree in range(r + 1)
+        for monomial in itertools.combinations(range(m), degree)
+    )
+
+@functools.lru_cache(maxsize=None)
+def rm_generator_matrix(r, m):
+    """Generator matrix of RM(r, m) as a cached read-only (k, 2**m) uint8 array.
+
+    Row of monomial x_i1 ... x_id evaluates it at every point j, where
+    x_i is bit i of the column index j.
+    """
+    point_bits = generator_matrix_rm1m(m)[1:]
+    monomials = rm_monomials(r, m)
+    matrix = np.ones((len(monomials), 2**m), dtype=np.uint8)
+    for row, monomial in enumerate(monomials):
+        for variable in monomial:
+            matrix[row] &= point_bits[variable]
+    matrix.flags.writeable = False
+    return matrix
+
+def rm_encode_batch(messages, r, m):
+    """Encodes a (words, k) array of message bits with RM(r, m) (GF(2) matrix product).
+
+    Message bit i is the coefficient of monomial `rm_monomials(r, m)[i]`.
+    """
+    generator = rm_generator_matrix(r, m)
+    messages = np.asarray(messages, dtype=np.uint8)
+    if messages.shape[-1] != generator.shape[0]:
+        raise ValueError("Message length must match the RM(r, m) dimension.")
+    return _gf2_matmul(messages.reshape(-1, generator.shape[0]), generator)
+
+def _deposit(values, variables):
+    """Scatters the bits of `values` to bit positions `variables`."""
+    out = np.zeros_like(values)
+    for bit, variable in enumerate(variables):
+        out |= ((values >> bit) & 1) << variable
+    return out
+
+@functools.lru_cache(maxsize=None)
+def rm_check_sums(r, m, degree):
+    """Reed check-sum index sets for all degree-`degree` monomials of RM(r, m).
+
+    For monomial x_S, each of the 2**(m - d) assignments of the variables
+    outside S fixes one check sum: the XOR of the 2**d positions that vary
+    over S. Every check sum equals the coefficient of x_S once the higher
+    degree terms are removed.
+
+    Returns:
+        tuple: (rows of `degree`-monomials in the basis, read-only index
+        array (monomials, 2**(m - d), 2**d)).
+    """
+    monomials = rm_monomials(r, m)
+    rows = [row for row, monomial in enumerate(monomials) if len(monomial) == degree]
+    inside = np.arange(2**degree)
+    outside = np.arange(2 ** (m - degree))
+    sets = np.empty((len(rows), outside.size, inside.size), dtype=np.intp)
+    for i, row in enumerate(rows):
+        variables = monomials[row]
+        others = [v for v in range(m) if v not in variables]
+        sets[i] = _deposit(outside, others)[:, None] | _deposit(inside, variables)[None, :]
+    sets.flags.writeable = False
+    return np.array(rows), sets
+
+def rm_decode_batch(received, r, m):
+    """Reed majority-logic decoding of RM(r, m), vectorized over words.
+
+    Degrees are decoded from r down to 0: every coefficient of that degree
+    is the majority of its check sums (`rm_check_sums`), and the decoded
+    part is then subtracted from the words. Corrects up to
+    2**(m - r - 1) - 1 errors per word; ties decide 0.
+
+    Args:
+        received: (words, 2**m) array of hard bits.
+
+    Returns:
+        np.ndarray: (words, k) uint8 messages in `rm_monomials` order.
+    """
+    generator = rm_generator_matrix(r, m)
+    received = np.asarray(received, dtype=np.uint8)
+    if received.shape[-1] != 2**m:
+        raise ValueError("Received words must have length 2**m.")
+    received = received.reshape(-1, 2**m)
+    messages = np.zeros((received.shape[0], generator.shape[0]), dtype=np.uint8)
+    batch = max(1, RM_DECODE_BATCH_BITS // (generator.shape[0] * 2**m))
+
+    for w0 in range(0, received.shape[0], batch):
+        # Positions as rows: every check-sum gather copies whole contiguous rows.
+        words = np.ascontiguousarray(received[w0 : w0 + batch].T)
+        decoded = messages[w0 : w0 + batch]
+        for degree in range(r, -1, -1):
+            rows, sets = rm_check_sums(r, m, degree)
+            check_sums = words[sets[..., 0]]
+            for offset in range(1, sets.shape[2]):
+                check_sums ^= words[sets[..., offset]]
+            votes = check_sums.sum(axis=1, dtype=np.intp)
+            decoded[:, rows] = (2 * votes > sets.shape[1]).T
+            words ^= _gf2_matmul(generator[rows].T, decoded[:, rows].T)
+    return messages
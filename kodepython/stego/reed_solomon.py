@@ -0,0 +1,285 @@
+"""Kode Reed-Solomon sistematik atas GF(256), tervektorisasi per blok.
+
+Parameter field sama dengan default `reedsolo.RSCodec` (polinom primitif
+0x11D, generator 2, fcr 0), sehingga codeword identik byte demi byte.
+Perkalian memakai tabel log/antilog: log(0) dipetakan ke `_LOG_ZERO` dan
+tabel antilog diperpanjang dengan nol, sehingga jumlah log yang melibatkan
+nol otomatis menghasilkan 0 tanpa percabangan. Paritas linear terhadap
+pesan, sehingga encoder cukup meng-XOR paritas tiap byte pesan dari tabel.
+"""
+
+import functools
+
+import numpy as np
+
+GF_PRIMITIVE = 0x11D
+GF_GENERATOR = 2
+FCR = 0
+BATCH_BLOCKS = 1 << 16
+
+_LOG_ZERO = 510
+
+
+def _gf_tables():
+    exp = np.zeros(1024, dtype=np.uint8)
+    log = np.full(256, _LOG_ZERO, dtype=np.int16)
+    x = 1
+    for i in range(255):
+        exp[i] = x
+        log[x] = i
+        x <<= 1
+        if x & 0x100:
+            x ^= GF_PRIMITIVE
+    exp[255:510] = exp[:255]
+    return exp, log
+
+
+GF_EXP, GF_LOG = _gf_tables()
+
+
+def gf_mul(a, b):
+    """Perkalian elemen-per-elemen dua array uint8 di GF(256)."""
+    return GF_EXP[GF_LOG[a] + GF_LOG[b]]
+
+
+def _poly_mul(p, q):
+    out = np.zeros(len(p) + len(q) - 1, dtype=np.uint8)
+    for i, coef in enumerate(p):
+        out[i : i + len(q)] ^= gf_mul(np.uint8(coef), q)
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def generator_poly(nsym):
+    """Polinom generator prod_{i<nsym} (x - a^(FCR + i)), koefisien pangkat tertinggi dulu."""
+    g = np.ones(1, dtype=np.uint8)
+    for i in range(nsym):
+        g = _poly_mul(g, np.array([1, GF_EXP[FCR + i]], dtype=np.uint8))
+    return g
+
+
+@functools.lru_cache(maxsize=None)
+def parity_log_matrix(message_length, nsym):
+    """Log paritas setiap pesan satuan e_j, berukuran (`message_length`, `nsym`).
+
+    Paritas bersifat linear atas GF(256), sehingga paritas pesan m adalah
+    XOR_j m_j * P[j]; baris P[j] dihitung sekali dengan pembagian polinom.
+    """
+    g = generator_poly(nsym)
+    rows = np.zeros((message_length, nsym), dtype=np.uint8)
+    for j in range(message_length):
+        remainder = np.zeros(message_length + nsym, dtype=np.uint8)
+        remainder[j] = 1
+        for i in range(message_length):
+            coef = remainder[i]
+            if coef:
+                remainder[i : i + nsym + 1] ^= gf_mul(np.uint8(coef), g)
+        rows[j] = remainder[message_length:]
+    return GF_LOG[rows]
+
+
+@functools.lru_cache(maxsize=None)
+def parity_tables(message_length, nsym):
+    """Tabel paritas per posisi byte pesan: T[j, v] = paritas pesan v * e_j.
+
+    Dibangun dari `parity_log_matrix` dengan tabel log/antilog dan disimpan
+    sebagai word uint64 (paritas dipadding ke kelipatan 8 byte), sehingga
+    encoding satu kolom pesan cukup satu gather dan satu XOR per blok.
+    Ukurannya `message_length` x 256 x ceil(nsym / 8) word.
+    """
+    words = -(-nsym // 8)
+    log_values = GF_LOG[np.arange(256)][None, :, None]
+    log_parity = parity_log_matrix(message_length, nsym)[:, None, :]
+    table = np.zeros((message_length, 256, words * 8), dtype=np.uint8)
+    table[:, :, :nsym] = GF_EXP[log_values + log_parity]
+    return table.view(np.uint64)
+
+
+def rs_encode_blocks(messages, nsym, out=None):
+    """Encoding sistematik semua blok sekaligus: codeword = pesan || paritas.
+
+    Args:
+        messages: Array uint8 (B, k), satu pesan per baris.
+        nsym: Jumlah byte paritas per blok; k + nsym paling besar 255.
+        out: Buffer uint8 (B, k + nsym) opsional untuk ditulis langsung.
+
+    Returns:
+        np.ndarray: Codeword uint8 (B, k + nsym).
+    """
+    messages = np.asarray(messages, dtype=np.uint8)
+    num_blocks, message_length = messages.shape
+    if message_length + nsym > 255:
+        raise ValueError("Panjang codeword Reed-Solomon GF(256) paling besar 255.")
+    if out is None:
+        out = np.empty((num_blocks, message_length + nsym), dtype=np.uint8)
+    tables = parity_tables(message_length, nsym)
+    out[:, :message_length] = messages
+
+    for b0 in range(0, num_blocks, BATCH_BLOCKS):
+        columns = np.ascontiguousarray(messages[b0 : b0 + BATCH_BLOCKS].T)
+        parity = tables[0][columns[0]]
+        for j in range(1, message_length):
+            parity ^= tables[j][columns[j]]
+        out[b0 : b0 + BATCH_BLOCKS, message_length:] = parity.view(np.uint8)[:, :nsym]
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def syndrome_tables(codeword_length, nsym):
+    """Tabel sindrom per posisi byte codeword: T[j, v] = (v * a^((FCR + i)(n - 1 - j)))_i.
+
+    Sindrom juga linear terhadap codeword, sehingga semua sindrom semua blok
+    dihitung dengan gather dan XOR seperti `parity_tables`.
+    """
+    words = -(-nsym // 8)
+    powers = (FCR + np.arange(nsym)) * (codeword_length - 1 - np.arange(codeword_length))[:, None]
+    log_alpha = (powers % 255)[:, None, :]
+    log_values = GF_LOG[np.arange(256)][None, :, None]
+    table = np.zeros((codeword_length, 256, words * 8), dtype=np.uint8)
+    table[:, :, :nsym] = GF_EXP[log_values + log_alpha]
+    return table.view(np.uint64)
+
+
+def rs_syndromes(codewords, nsym):
+    """Sindrom semua blok sekaligus, (B, ceil(nsym / 8)) word uint64; nol berarti bersih."""
+    codewords = np.asarray(codewords, dtype=np.uint8)
+    tables = syndrome_tables(codewords.shape[1], nsym)
+    columns = np.ascontiguousarray(codewords.T)
+    syndromes = tables[0][columns[0]]
+    for j in range(1, codewords.shape[1]):
+        syndromes ^= tables[j][columns[j]]
+    return syndromes
+
+
+_EXP = [int(v) for v in GF_EXP[:510]]
+_LOG = [int(v) for v in GF_LOG]
+
+
+def _mul(a, b):
+    return 0 if a == 0 or b == 0 else _EXP[_LOG[a] + _LOG[b]]
+
+
+def _div(a, b):
+    return 0 if a == 0 else _EXP[_LOG[a] + 255 - _LOG[b]]
+
+
+def _poly_eval(poly, x):
+    """Nilai polinom (koefisien pangkat terendah dulu) di x."""
+    y = 0
+    for coef in reversed(poly):
+        y = _mul(y, x) ^ coef
+    return y
+
+
+def _error_locator(syndromes):
+    """Berlekamp-Massey: polinom lokator galat Lambda (pangkat terendah dulu)."""
+    current, previous = [1], [1]
+    length, shift, last = 0, 1, 1
+    for r, syndrome in enumerate(syndromes):
+        delta = syndrome
+        for t in range(1, length + 1):
+            delta ^= _mul(current[t], syndromes[r - t])
+        if delta == 0:
+            shift += 1
+            continue
+        scale = _div(delta, last)
+        update = [0] * shift + [_mul(scale, coef) for coef in previous]
+        candidate = current + [0] * max(0, len(update) - len(current))
+        for t, coef in enumerate(update):
+            candidate[t] ^= coef
+        if 2 * length <= r:
+            previous, length, last, shift = current, r + 1 - length, delta, 1
+        else:
+            shift += 1
+        current = candidate
+    return current[: length + 1], length
+
+
+def _correct_block(codeword, syndromes):
+    """Koreksi satu codeword kotor dengan Berlekamp-Massey, Chien, dan Forney.
+
+    Returns:
+        tuple: (codeword terkoreksi sebagai list, True) atau (codeword asli, False)
+        jika galat melebihi kemampuan kode.
+    """
+    n = len(codeword)
+    nsym = len(syndromes)
+    locator, num_errors = _error_locator(syndromes)
+    if 2 * num_errors > nsym:
+        return codeword, False
+
+    # Chien: posisi j punya lokator X = a^(n - 1 - j), akar Lambda di X^-1.
+    positions = [
+        j for j in range(n) if _poly_eval(locator, _EXP[(255 - (n - 1 - j)) % 255]) == 0
+    ]
+    if len(positions) != num_errors:
+        return codeword, False
+
+    # Forney: e = X^(1 - FCR) * Omega(X^-1) / Lambda'(X^-1).
+    omega = [0] * nsym
+    for i, syndrome in enumerate(syndromes):
+        for t, coef in enumerate(locator[: nsym - i]):
+            omega[i + t] ^= _mul(syndrome, coef)
+    derivative = [coef if t % 2 else 0 for t, coef in enumerate(locator)][1:]
+    corrected = list(codeword)
+    for j in positions:
+        power = n - 1 - j
+        x_inv = _EXP[(255 - power) % 255]
+        denominator = _poly_eval(derivative, x_inv)
+        if denominator == 0:
+            return codeword, False
+        magnitude = _div(_poly_eval(omega, x_inv), denominator)
+        corrected[j] ^= _mul(magnitude, _EXP[(power * (1 - FCR)) % 255])
+    return corrected, True
+
+
+def _correct_blocks(task):
+    codewords, syndromes = task
+    results = [
+        _correct_block(codeword, syndrome)
+        for codeword, syndrome in zip(codewords.tolist(), syndromes.tolist())
+    ]
+    corrected = np.array([codeword for codeword, _ in results], dtype=np.uint8)
+    ok = np.array([success for _, success in results], dtype=bool)
+    return corrected.reshape(codewords.shape), ok
+
+
+def rs_decode_blocks(codewords, nsym, workers=None, min_parallel_blocks=4096):
+    """Decoding semua blok: sindrom tervektorisasi, koreksi hanya untuk blok kotor.
+
+    Blok dengan sindrom nol langsung diteruskan. Blok kotor dikoreksi dengan
+    Berlekamp-Massey/Forney di Python, dibagi ke `workers` proses jika
+    jumlahnya paling sedikit `min_parallel_blocks`.
+
+    Args:
+        codewords: Array uint8 (B, n) hasil ekstraksi.
+        nsym: Jumlah byte paritas per blok.
+        workers: Jumlah proses untuk blok kotor; None atau 1 berarti serial.
+
+    Returns:
+        tuple: (pesan uint8 (B, n - nsym), flag bool (B,) True jika blok
+        bersih atau berhasil dikoreksi). Blok yang gagal memakai byte pesan
+        apa adanya (kode sistematik).
+    """
+    codewords = np.array(codewords, dtype=np.uint8)
+    syndromes = rs_syndromes(codewords, nsym)
+    dirty = np.flatnonzero(np.any(syndromes, axis=1))
+    ok = np.ones(codewords.shape[0], dtype=bool)
+    if dirty.size:
+        blocks = codewords[dirty]
+        block_syndromes = syndromes[dirty].view(np.uint8)[:, :nsym]
+        if workers and workers > 1 and dirty.size >= min_parallel_blocks:
+            from concurrent.futures import ProcessPoolExecutor
+
+            parts = np.array_split(np.arange(dirty.size), workers)
+            tasks = [(blocks[part], block_syndromes[part]) for part in parts]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_correct_blocks, tasks))
+            corrected = np.concatenate([part for part, _ in results])
+            success = np.concatenate([flags for _, flags in results])
+        else:
+            corrected, success = _correct_blocks((blocks, block_syndromes))
+        success &= ~np.any(rs_syndromes(corrected, nsym), axis=1)
+        codewords[dirty[success]] = corrected[success]
+        ok[dirty] = success
+    return codewords[:, : codewords.shape[1] - nsym], ok
@@ -0,0 +1,150 @@
+"""Cache hasil (metrik dan secret hasil ekstraksi) berdasarkan hash isi gambar.
+
+Kunci cache adalah hash BLAKE2b dari nama fungsi, parameternya, serta isi
+(bentuk, dtype, dan byte) setiap gambar masukan, sehingga nama file atau
+waktu modifikasi tidak berpengaruh. Entri disimpan di satu database SQLite
+dan dibuang secara LRU jika ukuran total melebihi batas.
+"""
+
+import functools
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+CACHE_DIR = os.environ.get(
+    "STEGO_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "stego")
+)
+CACHE_MAX_BYTES = int(os.environ.get("STEGO_CACHE_MAX_BYTES", 1 << 30))
+# Naikkan jika perilaku embedding, ekstraksi, atau metrik berubah.
+CACHE_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+def array_digest(array):
+    """Hash isi array: bentuk, dtype, dan byte dalam urutan C."""
+    array = np.ascontiguousarray(array)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{array.dtype.str}{array.shape}".encode())
+    h.update(memoryview(array).cast("B"))
+    return h.hexdigest()
+
+
+def cache_key(name, arrays, params):
+    """Kunci cache untuk `name` dengan gambar masukan `arrays` dan parameter `params`."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{CACHE_VERSION}:{name}:".encode())
+    h.update(json.dumps(params, sort_keys=True, default=str).encode())
+    for array in arrays:
+        h.update(array_digest(array).encode())
+    return h.hexdigest()
+
+
+def _dumps(value):
+    if isinstance(value, np.ndarray):
+        buffer = io.BytesIO()
+        np.save(buffer, value, allow_pickle=False)
+        return "npy", buffer.getvalue()
+    return "json", json.dumps(value).encode()
+
+
+def _loads(kind, blob):
+    if kind == "npy":
+        return np.load(io.BytesIO(blob), allow_pickle=False)
+    return json.loads(blob)
+
+
+class ResultCache:
+    """Cache LRU berbatas ukuran di atas SQLite, aman dipakai beberapa proses sekaligus."""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._db = sqlite3.connect(os.path.join(cache_dir, "results.sqlite"), timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def get(self, key):
+        """Nilai untuk `key` (dan tandai baru dipakai), atau None jika tidak ada."""
+        row = self._db.execute("SELECT kind, value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with self._db:
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return _loads(*row)
+
+    def put(self, key, value):
+        """Menyimpan dict/list (JSON) atau array numpy, lalu membuang entri tertua jika perlu."""
+        kind, blob = _dumps(value)
+        if len(blob) > self.max_bytes:
+            return
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, kind, blob, len(blob), time.time()),
+            )
+            self._evict()
+
+    def _evict(self):
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        stale = []
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed"):
+            stale.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._db.executemany("DELETE FROM entries WHERE key = ?", stale)
+
+    def total_bytes(self):
+        """Ukuran total nilai yang tersimpan, dalam byte."""
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def clear(self):
+        """Menghapus semua entri."""
+        with self._db:
+            self._db.execute("DELETE FROM entries")
+
+
+@functools.lru_cache(maxsize=None)
+def default_cache():
+    """Satu `ResultCache` per proses di `STEGO_CACHE_DIR`."""
+    return ResultCache()
+
+
+def memoize(name, arrays, params, compute, cache=None):
+    """Mengembalikan hasil `compute()` dari cache jika gambar dan parameternya sama.
+
+    Args:
+        name: Nama fungsi, bagian dari kunci.
+        arrays: Gambar masukan yang isinya di-hash.
+        params: Parameter lain (harus dapat di-serialisasi JSON).
+        compute: Fungsi tanpa argumen yang menghitung hasil jika cache meleset.
+        cache: `ResultCache`; None memakai `default_cache()`, False menonaktifkan cache.
+    """
+    if cache is False:
+        return compute()
+    cache = cache or default_cache()
+    key = cache_key(name, arrays, params)
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.put(key, value)
+    return value
@@ -0,0 +1,176 @@
+"""Pemilihan piksel pseudo-acak berbasis kunci dengan permutasi Feistel.
+
+Piksel ke-k yang dipilih adalah `permute_indices(k)`: permutasi Feistel
+seimbang atas domain 2^(2h) >= jumlah piksel, dengan cycle-walking agar
+hasilnya selalu di dalam [0, jumlah piksel). Karena berupa permutasi, tidak
+ada piksel yang terpilih dua kali, dan posisi dapat dihitung per potongan
+tanpa pernah membuat permutasi seluruh gambar.
+
+Urutan "global" mengacak seluruh pembawa sekaligus, sehingga pada cover
+besar setiap tulisan LSB jatuh di cache line yang berbeda. Urutan "tiled"
+mengacak urutan tile berukuran `TILE_SAMPLES` dan urutan di dalam setiap
+tile (permutasi per tile dibedakan dengan tweak), sehingga satu tile tetap
+panas di cache selama ditulis.
+"""
+
+import functools
+import hashlib
+
+import numpy as np
+
+FEISTEL_ROUNDS = 6
+SELECTION_CHUNK = 1 << 20
+DEFAULT_KEY = 0
+ORDERS = ("global", "tiled")
+TILE_SAMPLES = 1 << 15
+
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def _key_bytes(key):
+    if isinstance(key, (bytes, bytearray)):
+        return bytes(key)
+    return str(key).encode()
+
+
+@functools.lru_cache(maxsize=64)
+def _round_keys(key_bytes, domain_size, rounds):
+    digest = hashlib.blake2b(key_bytes, digest_size=8 * rounds, person=b"stego-feistel")
+    digest.update(domain_size.to_bytes(8, "little"))
+    return tuple(np.frombuffer(digest.digest(), dtype=np.uint64))
+
+
+def feistel_round_keys(key, domain_size, rounds=FEISTEL_ROUNDS):
+    """Kunci ronde 64-bit yang diturunkan dari `key` dan ukuran domain (BLAKE2b).
+
+    Kunci dinormalisasi ke bytes sebelum cache LRU, sehingga kunci yang tidak
+    hashable seperti bytearray juga dapat dipakai.
+    """
+    return _round_keys(_key_bytes(key), int(domain_size), int(rounds))
+
+
+def _round_function(right, round_key, mask):
+    """Finalizer splitmix64 atas R ^ kunci ronde, dipotong ke lebar setengah blok."""
+    z = right ^ round_key
+    z = (z ^ (z >> np.uint64(30))) * _MIX1
+    z = (z ^ (z >> np.uint64(27))) * _MIX2
+    return (z ^ (z >> np.uint64(31))) & mask
+
+
+def _feistel(values, half_bits, round_keys, tweak):
+    shift = np.uint64(half_bits)
+    mask = np.uint64((1 << half_bits) - 1)
+    left, right = values >> shift, values & mask
+    for round_key in round_keys:
+        left, right = right, left ^ _round_function(right, round_key ^ tweak, mask)
+    return (left << shift) | right
+
+
+def permute_indices(indices, domain_size, key=DEFAULT_KEY, tweak=0):
+    """Memetakan indeks urutan pemilihan ke indeks piksel dalam [0, `domain_size`).
+
+    Args:
+        indices: Array indeks urutan (0 <= k < `domain_size`).
+        domain_size: Jumlah sampel pembawa.
+        key: Kunci rahasia (int, str, atau bytes) yang sama saat embed dan ekstraksi.
+        tweak: Skalar atau array uint64 sebesar `indices`; tweak berbeda
+            menghasilkan permutasi berbeda dengan kunci yang sama.
+
+    Returns:
+        np.ndarray: Indeks piksel (intp) yang unik untuk indeks yang berbeda.
+    """
+    if domain_size < 1:
+        raise ValueError("Domain pemilihan piksel kosong.")
+    half_bits = max(1, (int(domain_size - 1).bit_length() + 1) // 2)
+    round_keys = feistel_round_keys(key, int(domain_size))
+    limit = np.uint64(domain_size)
+    tweak = np.asarray(tweak, dtype=np.uint64)
+
+    values = _feistel(np.asarray(indices, dtype=np.uint64), half_bits, round_keys, tweak)
+    outside = np.flatnonzero(values >= limit)
+    # Cycle-walking: enkripsi ulang sampai jatuh di dalam domain.
+    while outside.size:
+        outside_tweak = tweak if tweak.ndim == 0 else tweak[outside]
+        walked = _feistel(values[outside], half_bits, round_keys, outside_tweak)
+        values[outside] = walked
+        outside = outside[walked >= limit]
+    return values.astype(np.intp)
+
+
+def _tile_keys(tiles, round_keys, bits):
+    """Kunci per tile (satu per ronde, `bits` bit) dari nomor tile via splitmix64."""
+    mask = np.uint64((1 << bits) - 1)
+    tiles = tiles.astype(np.uint64) + np.uint64(1)
+    return [_round_function(tiles, key, mask).astype(np.uint32) for key in round_keys]
+
+
+def _permute_in_tile(offsets, keys, multipliers, bits):
+    """Permutasi murah di dalam tile 2^`bits`: XOR kunci, kali bilangan ganjil, xorshift.
+
+    Setiap langkah bijektif modulo 2^`bits`, sehingga hasilnya permutasi tanpa
+    cycle-walking; `keys` berbeda per tile sehingga setiap tile teracak berbeda.
+    Dengan `bits` <= 16 semua hasil kali muat di uint32.
+    """
+    mask = np.uint32((1 << bits) - 1)
+    shift = np.uint32(bits // 2 + 1)
+    x = offsets.astype(np.uint32)
+    for key, multiplier in zip(keys, multipliers):
+        x ^= key
+        x *= multiplier
+        x &= mask
+        x ^= x >> shift
+    return x
+
+
+def permute_indices_tiled(indices, domain_size, key=DEFAULT_KEY, tile_size=TILE_SAMPLES):
+    """Seperti `permute_indices`, tetapi acak per tile: urutan tile lalu isi tile.
+
+    Indeks k jatuh di tile urutan k // `tile_size` (pangkat dua). Tile penuh
+    diacak urutannya dengan Feistel, tile sisa (tidak penuh) selalu terakhir.
+    Isi tile penuh diacak dengan `_permute_in_tile` berkunci per tile,
+    sedangkan tile sisa memakai Feistel.
+    """
+    bits = int(tile_size).bit_length() - 1
+    if tile_size != 1 << bits or bits > 16:
+        raise ValueError("Ukuran tile pemilihan harus pangkat dua, paling besar 2^16.")
+    indices = np.asarray(indices, dtype=np.intp)
+    full_tiles = domain_size // tile_size
+    rank, offset = np.divmod(indices, tile_size)
+    positions = np.empty_like(indices)
+
+    in_full = rank < full_tiles
+    if np.any(in_full):
+        # Hanya sedikit tile berbeda per potongan: permutasi dihitung per tile.
+        inverse = rank[in_full]
+        first = inverse.min()
+        inverse -= first
+        tiles = permute_indices(np.arange(first, first + inverse.max() + 1), full_tiles, key)
+        round_keys = feistel_round_keys(key, int(domain_size))
+        keys = [tile_key[inverse] for tile_key in _tile_keys(tiles, round_keys, bits)]
+        multipliers = [np.uint32((int(k) | 1) & ((1 << bits) - 1)) for k in round_keys]
+        inner = _permute_in_tile(offset[in_full], keys, multipliers, bits)
+        positions[in_full] = tiles[inverse] * tile_size + inner
+    if not np.all(in_full):
+        remainder = domain_size - full_tiles * tile_size
+        inner = permute_indices(offset[~in_full], remainder, key, full_tiles + 1)
+        positions[~in_full] = full_tiles * tile_size + inner
+    return positions
+
+
+def selection_chunks(
+    count, domain_size, key=DEFAULT_KEY, order="global", chunk_size=SELECTION_CHUNK
+):
+    """Menghasilkan (awal, posisi) untuk `count` piksel pertama, per `chunk_size`.
+
+    `order` memilih "global" (`permute_indices`) atau "tiled"
+    (`permute_indices_tiled`).
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Urutan pemilihan harus salah satu dari {ORDERS}.")
+    if count > domain_size:
+        raise ValueError("Jumlah piksel yang dipilih melebihi jumlah sampel pembawa.")
+    permute = permute_indices if order == "global" else permute_indices_tiled
+    for start in range(0, count, chunk_size):
+        stop = min(count, start + chunk_size)
+        yield start, permute(np.arange(start, stop), domain_size, key)
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+
+TILE_PIXELS = 1 << 22
+
+
+def open_cover(path, shape=None, dtype=np.uint8):
+    """Membuka cover `.npy` atau raw sebagai memmap read-only (tanpa memuat ke RAM).
+
+    Untuk file raw, `shape` (H, W) atau (H, W, C) wajib diberikan.
+    """
+    if os.path.splitext(path)[1].lower() == ".npy":
+        return np.load(path, mmap_mode="r")
+    if shape is None:
+        raise ValueError("Shape wajib diberikan untuk cover raw.")
+    return np.memmap(path, dtype=dtype, mode="r", shape=tuple(shape))
+
+
+def create_output(path, shape, dtype=np.uint8):
+    """Membuat file output `.npy` atau raw sebagai memmap yang dapat ditulis."""
+    if os.path.splitext(path)[1].lower() == ".npy":
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=tuple(shape))
+    return np.memmap(path, dtype=dtype, mode="w+", shape=tuple(shape))
+
+
+def stego_shape(cover_shape, layout=None):
+    """Bentuk stego image: grayscale (H, W) jika `layout` None, selain itu sama dengan cover."""
+    return tuple(cover_shape[:2]) if layout is None else tuple(cover_shape)
+
+
+def row_bands(shape, tile_pixels=TILE_PIXELS):
+    """Rentang baris (r0, r1) sehingga setiap band berisi sekitar `tile_pixels` piksel."""
+    rows = max(1, tile_pixels // shape[1])
+    for r0 in range(0, shape[0], rows):
+        yield r0, min(shape[0], r0 + rows)
+
+
+def load_band(cover, r0, r1, layout=None):
+    """Menyalin satu band cover ke RAM, dikonversi ke grayscale jika `layout` None."""
+    band = cover[r0:r1]
+    if layout is None and band.ndim == 3:
+        import cv2
+
+        return cv2.cvtColor(np.ascontiguousarray(band), cv2.COLOR_BGR2GRAY)
+    return np.array(band, order="C")
+
+
+def band_segments(band, r0, shape, layout=None):
+    """Pasangan (offset urutan pembawa, view 1-D) untuk band yang dimulai di baris `r0`.
+
+    Offset mengikuti urutan `lsb.carrier_segments` pada image utuh berbentuk
+    `shape`, sehingga hasil per tile identik dengan jalur in-memory.
+    """
+    width = shape[1]
+    if layout == "planar" and band.ndim == 3:
+        num_pixels = shape[0] * width
+        pixels = band.reshape(-1, band.shape[2])
+        return [
+            (channel * num_pixels + r0 * width, pixels[:, channel])
+            for channel in range(band.shape[2])
+        ]
+    per_row = width * (band.shape[2] if band.ndim == 3 else 1)
+    return [(r0 * per_row, band.reshape(-1))]
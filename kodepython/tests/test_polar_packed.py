@@ -0,0 +1,57 @@
+"""Jalur polar ter-pack harus identik dengan jalur per bit."""
+
+import numpy as np
+import pytest
+
+from stego.polar import (
+    CRC16_CCITT,
+    decode,
+    decode_packed,
+    encode,
+    encode_packed,
+    hard_to_llr,
+)
+from stego.polar_construction import info_set as construct_info_set
+
+BLOCK_LENGTH = 64
+INFO_SIZE = 40
+
+
+@pytest.fixture(scope="module")
+def positions():
+    return construct_info_set(BLOCK_LENGTH, INFO_SIZE, 0.0, "bhattacharyya")
+
+
+@pytest.mark.parametrize("num_bits", [8, 1000, 4093])
+@pytest.mark.parametrize("crc_poly", [None, CRC16_CCITT])
+def test_encode_packed_matches_bit_path(positions, num_bits, crc_poly):
+    rng = np.random.default_rng(num_bits)
+    payload = rng.integers(0, 256, -(-num_bits // 8), dtype=np.uint8)
+    bits = np.unpackbits(payload)[:num_bits]
+
+    expected = np.packbits(encode(bits, BLOCK_LENGTH, positions, crc_poly))
+    packed = encode_packed(payload, num_bits, BLOCK_LENGTH, positions, crc_poly, batch_size=16)
+    np.testing.assert_array_equal(packed, expected)
+
+
+@pytest.mark.parametrize("num_bits", [8, 1000, 4093])
+@pytest.mark.parametrize("list_size, crc_poly", [(1, None), (4, CRC16_CCITT)])
+def test_decode_packed_matches_bit_path(positions, num_bits, list_size, crc_poly):
+    rng = np.random.default_rng(num_bits + list_size)
+    payload = rng.integers(0, 256, -(-num_bits // 8), dtype=np.uint8)
+    codeword = encode(np.unpackbits(payload)[:num_bits], BLOCK_LENGTH, positions, crc_poly)
+    codeword ^= (rng.random(codeword.size) < 0.02).astype(np.uint8)
+
+    expected = decode(
+        hard_to_llr(codeword), num_bits, BLOCK_LENGTH, positions, list_size, crc_poly
+    )
+    decoded = decode_packed(
+        np.packbits(codeword),
+        num_bits,
+        BLOCK_LENGTH,
+        positions,
+        list_size,
+        crc_poly,
+        batch_size=32,
+    )
+    np.testing.assert_array_equal(np.unpackbits(decoded)[:num_bits], expected)
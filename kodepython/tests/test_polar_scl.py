@@ -0,0 +1,67 @@
+"""SCL dengan memori jalur ber-pointer dibandingkan dengan SCL salin-penuh sederhana."""
+
+import numpy as np
+import pytest
+
+from stego.polar import CRC8, crc_bits, crc_width, encode, polar_transform, scl_decode_blocks
+from stego.polar_construction import info_set as construct_info_set
+
+
+def _bit_llr(llr, u_prefix, i):
+    """LLR min-sum bit u_i dari LLR kanal dan keputusan u_0..u_{i-1} (rekursif)."""
+    if llr.size == 1:
+        return llr[0]
+    half = llr.size // 2
+    left, right = llr[:half], llr[half:]
+    if i < half:
+        child = np.copysign(np.minimum(np.abs(left), np.abs(right)), left * right)
+        return _bit_llr(child, u_prefix, i)
+    partial = np.array(u_prefix[None, :half], dtype=np.uint8)
+    if half > 1:
+        polar_transform(partial)
+    partial = partial[0]
+    child = right + (1 - 2 * partial.astype(np.float32)) * left
+    return _bit_llr(child, u_prefix[half:], i - half)
+
+
+def _reference_scl(llr, info_set, list_size, crc_poly):
+    """SCL satu codeword: setiap jalur menyimpan salinan penuh vektor u."""
+    block_length = llr.size
+    info_mask = np.zeros(block_length, dtype=bool)
+    info_mask[info_set] = True
+    paths = [(np.float32(0), np.zeros(0, dtype=np.uint8))]
+    for i in range(block_length):
+        candidates = []
+        for metric, u in paths:
+            lam = _bit_llr(llr, u, i)
+            candidates.append((metric + max(-lam, 0), np.append(u, 0)))
+            if info_mask[i]:
+                candidates.append((metric + max(lam, 0), np.append(u, 1)))
+        candidates.sort(key=lambda path: path[0])
+        paths = candidates[:list_size]
+
+    infos = [u[info_set] for _, u in paths]
+    if crc_poly is not None:
+        width = crc_width(crc_poly)
+        valid = [info for info in infos if (crc_bits(info[:-width], crc_poly) == info[-width:]).all()]
+        if valid:
+            return valid[0]
+    return infos[0]
+
+
+@pytest.mark.parametrize(
+    "block_length, info_size, list_size, crc_poly",
+    [(16, 8, 4, None), (32, 16, 8, CRC8), (64, 32, 4, CRC8)],
+)
+def test_scl_matches_full_copy_reference(block_length, info_size, list_size, crc_poly):
+    rng = np.random.default_rng(block_length + list_size)
+    positions = construct_info_set(block_length, info_size, 0.0, "bhattacharyya")
+    num_words = 32
+    data = rng.integers(0, 2, num_words * (info_size - crc_width(crc_poly)), dtype=np.uint8)
+    codewords = encode(data, block_length, positions, crc_poly).reshape(num_words, block_length)
+    llr = (1 - 2 * codewords.astype(np.float32)) * 2 + rng.normal(0, 2.5, codewords.shape)
+    llr = llr.astype(np.float32)
+
+    decoded, _ = scl_decode_blocks(llr, positions, list_size, crc_poly)
+    expected = [_reference_scl(word, positions, list_size, crc_poly) for word in llr]
+    np.testing.assert_array_equal(decoded, np.array(expected))
@@ -0,0 +1,68 @@
+"""Kode Reed-Muller: decoding RM(1, m) dengan FWHT dan decoding majority-logic RM(r, m)."""
+
+import numpy as np
+import pytest
+
+from stego.reed_muller import (
+    decode_rm1m_batch,
+    encode_rm1m_batch,
+    generator_matrix_rm1m,
+    rm_decode_batch,
+    rm_encode_batch,
+    rm_generator_matrix,
+    rm_monomials,
+)
+
+
+def _flip_random_bits(codewords, num_errors, rng):
+    """Membalik tepat `num_errors` bit acak berbeda di setiap codeword."""
+    noisy = codewords.copy()
+    for row in noisy:
+        row[rng.choice(row.size, num_errors, replace=False)] ^= 1
+    return noisy
+
+
+@pytest.mark.parametrize("m", [2, 3, 5, 8, 10])
+def test_fwht_decoder_corrects_below_half_distance(m):
+    # RM(1, m) berjarak minimum d = 2**(m - 1); kurang dari d/2 galat selalu terkoreksi.
+    rng = np.random.default_rng(m)
+    messages = rng.integers(0, 2, (64, m + 1), dtype=np.uint8)
+    codewords = encode_rm1m_batch(messages, m)
+    for num_errors in range(2 ** (m - 2)):
+        noisy = _flip_random_bits(codewords, num_errors, rng)
+        np.testing.assert_array_equal(decode_rm1m_batch(noisy, m), messages)
+
+
+def test_fwht_soft_decoding_matches_hard_on_clean_llrs():
+    m = 6
+    rng = np.random.default_rng(0)
+    messages = rng.integers(0, 2, (32, m + 1), dtype=np.uint8)
+    codewords = encode_rm1m_batch(messages, m)
+    llr = (1 - 2 * codewords.astype(np.float32)) * rng.uniform(0.5, 3.0, codewords.shape)
+    np.testing.assert_array_equal(decode_rm1m_batch(llr, m, soft=True), messages)
+
+
+@pytest.mark.parametrize("m", [1, 3, 5, 8])
+def test_rm_generator_matrix_reproduces_rm1m(m):
+    np.testing.assert_array_equal(rm_generator_matrix(1, m), generator_matrix_rm1m(m))
+
+
+@pytest.mark.parametrize("m", [3, 6])
+def test_rm1_encoder_matches_rm1m_encoder(m):
+    rng = np.random.default_rng(m)
+    messages = rng.integers(0, 2, (16, m + 1), dtype=np.uint8)
+    np.testing.assert_array_equal(rm_encode_batch(messages, 1, m), encode_rm1m_batch(messages, m))
+
+
+@pytest.mark.parametrize(
+    "r, m", [(0, 1), (0, 4), (1, 4), (2, 5), (3, 6), (2, 7), (3, 3), (5, 5)]
+)
+def test_majority_logic_corrects_up_to_t_errors(r, m):
+    # t = 2**(m - r - 1) - 1; untuk r = m (tanpa redundansi) t = 0.
+    rng = np.random.default_rng(10 * r + m)
+    messages = rng.integers(0, 2, (48, len(rm_monomials(r, m))), dtype=np.uint8)
+    codewords = rm_encode_batch(messages, r, m)
+    max_errors = 2 ** (m - r - 1) - 1 if r < m else 0
+    for num_errors in range(max_errors + 1):
+        noisy = _flip_random_bits(codewords, num_errors, rng)
+        np.testing.assert_array_equal(rm_decode_batch(noisy, r, m), messages)
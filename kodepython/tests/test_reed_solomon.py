@@ -0,0 +1,87 @@
+"""Reed-Solomon GF(256) terhadap vektor tetap dari `reedsolo.RSCodec`."""
+
+import numpy as np
+import pytest
+
+from stego import reed_solomon
+from stego.reed_solomon import rs_decode_blocks, rs_encode_blocks
+
+# (pesan, nsym, codeword) dari reedsolo.RSCodec(nsym).encode(pesan).
+VECTORS = [
+    (bytes(range(1, 12)), 5, [18, 232, 189, 13, 74]),
+    (b"polar", 4, [124, 172, 80, 224]),
+    (
+        bytes(range(0, 223, 7)),
+        16,
+        [110, 28, 4, 114, 14, 32, 148, 192, 192, 134, 218, 112, 229, 74, 14, 211],
+    ),
+    (bytes(20), 10, [0] * 10),
+]
+
+
+@pytest.mark.parametrize("message, nsym, parity", VECTORS)
+def test_encode_matches_reedsolo(message, nsym, parity):
+    messages = np.frombuffer(message, dtype=np.uint8)[None, :]
+    codeword = rs_encode_blocks(messages, nsym)
+    assert codeword.tolist() == [list(message) + parity]
+
+
+def test_encode_blocks_independently(monkeypatch):
+    monkeypatch.setattr(reed_solomon, "BATCH_BLOCKS", 64)
+    rng = np.random.default_rng(0)
+    messages = rng.integers(0, 256, (300, 11), dtype=np.uint8)
+    codewords = rs_encode_blocks(messages, 5)
+    for row in (0, 137, 299):
+        np.testing.assert_array_equal(codewords[row], rs_encode_blocks(messages[row : row + 1], 5)[0])
+    np.testing.assert_array_equal(codewords[:, :11], messages)
+
+
+def test_encode_rejects_long_codeword():
+    with pytest.raises(ValueError):
+        rs_encode_blocks(np.zeros((1, 250), dtype=np.uint8), 6)
+
+
+def _corrupt(codewords, num_errors, rng):
+    corrupted = codewords.copy()
+    for row, count in enumerate(num_errors):
+        positions = rng.choice(codewords.shape[1], count, replace=False)
+        corrupted[row, positions] ^= rng.integers(1, 256, count, dtype=np.uint8)
+    return corrupted
+
+
+@pytest.mark.parametrize("message, nsym, parity", VECTORS)
+def test_decode_fixed_vectors_up_to_t_errors(message, nsym, parity):
+    codeword = np.array([list(message) + parity], dtype=np.uint8)
+    rng = np.random.default_rng(nsym)
+    for num_errors in range(nsym // 2 + 1):
+        decoded, ok = rs_decode_blocks(_corrupt(codeword, [num_errors], rng), nsym)
+        assert ok.tolist() == [True]
+        assert decoded.tobytes() == message
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_decode_corrects_up_to_t_errors_per_block(workers):
+    nsym = 6
+    rng = np.random.default_rng(1)
+    messages = rng.integers(0, 256, (400, 26), dtype=np.uint8)
+    num_errors = rng.integers(0, nsym // 2 + 1, messages.shape[0])
+    corrupted = _corrupt(rs_encode_blocks(messages, nsym), num_errors, rng)
+
+    decoded, ok = rs_decode_blocks(corrupted, nsym, workers=workers, min_parallel_blocks=1)
+    assert ok.all()
+    np.testing.assert_array_equal(decoded, messages)
+
+
+def test_decode_flags_blocks_beyond_t_errors():
+    nsym = 4
+    rng = np.random.default_rng(2)
+    messages = rng.integers(0, 256, (200, 11), dtype=np.uint8)
+    corrupted = _corrupt(rs_encode_blocks(messages, nsym), [nsym] * 200, rng)
+
+    decoded, ok = rs_decode_blocks(corrupted, nsym)
+    # Blok yang gagal memakai pesan apa adanya; blok yang "berhasil" (salah
+    # koreksi) harus berjarak paling banyak t dari codeword yang diterima.
+    assert not ok.all()
+    np.testing.assert_array_equal(decoded[~ok], corrupted[~ok, :11])
+    distance = np.count_nonzero(rs_encode_blocks(decoded[ok], nsym) != corrupted[ok], axis=1)
+    assert np.all(distance <= nsym // 2)
@@ -0,0 +1,49 @@
+"""Jalur ber-tile (memmap) harus identik bit demi bit dengan jalur di memori."""
+
+import numpy as np
+import pytest
+
+from stego.polar_stego import embed_image, embed_image_tiled, extract_image_tiled
+
+HEIGHT, WIDTH = 203, 64
+# 9 baris per band: tidak membagi habis 203 baris, sehingga band terakhir tidak penuh.
+# Payload mencakup beberapa band untuk setiap layout dan num_lsb.
+TILE_PIXELS = 9 * WIDTH
+
+
+@pytest.fixture(scope="module")
+def images():
+    rng = np.random.default_rng(8)
+    cover = rng.integers(0, 256, (HEIGHT, WIDTH, 3), dtype=np.uint8)
+    secret = rng.integers(0, 256, (32, 24), dtype=np.uint8)
+    return cover, secret
+
+
+@pytest.mark.parametrize("layout", [None, "interleaved", "planar"])
+@pytest.mark.parametrize("num_lsb", [1, 2, 3, 4])
+def test_tiled_matches_in_memory(tmp_path, images, layout, num_lsb):
+    cover, secret = images
+    cover_path = str(tmp_path / "cover.npy")
+    stego_path = str(tmp_path / "stego.npy")
+    np.save(cover_path, cover)
+
+    expected, expected_distortion = embed_image(
+        cover, secret, num_lsb, layout=layout, return_distortion=True
+    )
+    shape, distortion = embed_image_tiled(
+        cover_path,
+        stego_path,
+        secret,
+        num_lsb,
+        layout=layout,
+        tile_pixels=TILE_PIXELS,
+        return_distortion=True,
+    )
+    assert shape == expected.shape
+    np.testing.assert_array_equal(np.load(stego_path), expected)
+    assert distortion == expected_distortion
+
+    extracted = extract_image_tiled(
+        stego_path, secret.shape, num_lsb, layout=layout, tile_pixels=TILE_PIXELS
+    )
+    np.testing.assert_array_equal(extracted, secret)